@@ -7,39 +7,119 @@ import os
 import sys
 import subprocess
 import shutil
+import argparse
+import importlib.util
+from pathlib import Path
+
+from dir_size import print_dir_size
+
+# Project root (parent of scripts/), resolved once at import time
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+def onefile_requested():
+    """Return True if the legacy single-file build was requested via PYINSTALLER_BUILD_ONEFILE=yes"""
+    return os.environ.get("PYINSTALLER_BUILD_ONEFILE", "").lower() == "yes"
 
 def check_pyinstaller():
     """Check if PyInstaller is installed"""
-    try:
-        import PyInstaller
+    # find_spec locates the package without executing its __init__ (which is slow);
+    # the real import happens in the `python -m PyInstaller` subprocess anyway.
+    if importlib.util.find_spec("PyInstaller") is not None:
         print("✓ PyInstaller is installed")
         return True
-    except ImportError:
-        print("✗ PyInstaller is not installed")
-        print("Installing PyInstaller...")
+    print("✗ PyInstaller is not installed")
+    print("Installing PyInstaller...")
+    try:
+        # Try UV first, fall back to pip
         try:
-            # Try UV first, fall back to pip
-            try:
-                subprocess.check_call(["uv", "pip", "install", "pyinstaller"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                print("✓ PyInstaller installed successfully using UV")
-                return True
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                # Fall back to pip
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-                print("✓ PyInstaller installed successfully using pip")
-                return True
-        except subprocess.CalledProcessError:
-            print("✗ Failed to install PyInstaller")
-            return False
+            subprocess.check_call(["uv", "pip", "install", "--python", sys.executable, "pyinstaller"],
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            print("✓ PyInstaller installed successfully using UV")
+            return True
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            # Fall back to pip
+            # Skip pip's self-update check and never try to build from source
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check",
+                "--no-input",
+                "--only-binary=:all:",
+                "pyinstaller",
+            ])
+            print("✓ PyInstaller installed successfully using pip")
+            return True
+    except subprocess.CalledProcessError:
+        print("✗ Failed to install PyInstaller")
+        return False
 
-def clean_build_dirs():
-    """Clean previous build directories and exe files"""
-    # Change to parent directory (project root)
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    os.chdir(project_root)
-    
+def check_upx():
+    """Check if UPX is available for compressing the bundled binaries"""
+    upx_path = shutil.which("upx")
+    if upx_path:
+        print(f"✓ UPX found: {upx_path}")
+        return os.path.dirname(upx_path)
+    print("⚠️  UPX not found. Building without UPX compression.")
+    print("   Install UPX from https://upx.github.io/ for a smaller bundle.")
+    return None
+
+# Modules with the hot filter/tree-building loops; compiled with --cython
+CYTHON_MODULES = ["src/DBCUtility.py", "src/search_module.py"]
+
+# PyInstaller cannot scan the imports of a compiled module, so everything
+# reached only through CYTHON_MODULES has to be named explicitly
+CYTHON_HIDDEN_IMPORTS = ["home_screen", "about_dialog", "resource_utils"]
+
+def cythonize_modules():
+    """
+    Compile CYTHON_MODULES in place to C extensions (Cython pure-Python mode).
+    The .py sources are left untouched; the extension modules sitting next to
+    them take import precedence, so PyInstaller bundles those instead.
+    Returns the list of generated files (to be removed after the build).
+    """
+    if importlib.util.find_spec("Cython") is None:
+        print("⚠️  Cython not installed. Building pure-Python modules.")
+        print("   Install it with: pip install cython")
+        return []
+    print("Compiling modules with Cython...")
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "Cython.Build.Cythonize",
+            "-i", "-3", "-q", *CYTHON_MODULES,
+        ])
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️  Cython compilation failed ({e}). Building pure-Python modules.")
+        return remove_cython_output()
+    print("✓ Compiled " + ", ".join(os.path.basename(m) for m in CYTHON_MODULES))
+    return list(cython_outputs())
+
+def cython_outputs():
+    """Yield the .c/.so/.pyd files Cython generated for CYTHON_MODULES"""
+    for module in CYTHON_MODULES:
+        folder, name = os.path.split(module)
+        stem = os.path.splitext(name)[0]
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.startswith(stem + ".") and entry.name.endswith((".c", ".so", ".pyd")):
+                    yield entry.path
+
+def remove_cython_output():
+    """Delete generated Cython files so source runs use the .py modules again"""
+    for path in list(cython_outputs()):
+        os.remove(path)
+    # Cythonize -i also leaves its setuptools build/ directory next to the modules
+    for folder in {os.path.dirname(m) for m in CYTHON_MODULES}:
+        shutil.rmtree(os.path.join(folder, "build"), ignore_errors=True)
+    return []
+
+def clean_build_dirs(clean=False):
+    """
+    Clean previous build output and exe files.
+    The PyInstaller work directory (build/) is kept between runs so the analysis
+    stage can be reused; pass clean=True to remove it as well.
+    Expects the current directory to be the project root (see main()).
+    """
     # Clean build directories
-    dirs_to_clean = ['build', 'dist']
+    dirs_to_clean = ['build', 'dist'] if clean else ['dist']
     for dir_name in dirs_to_clean:
         if os.path.exists(dir_name):
             print(f"Cleaning {dir_name} directory...")
@@ -47,7 +127,8 @@ def clean_build_dirs():
             print(f"✓ Cleaned {dir_name}")
     
     # Clean existing exe files in project root
-    exe_files = [f for f in os.listdir('.') if f.endswith('.exe')]
+    with os.scandir('.') as it:
+        exe_files = [e.name for e in it if e.is_file(follow_symlinks=False) and e.name.endswith('.exe')]
     for exe_file in exe_files:
         try:
             print(f"Deleting existing exe file: {exe_file}")
@@ -56,13 +137,10 @@ def clean_build_dirs():
         except Exception as e:
             print(f"Warning: Could not delete {exe_file}: {e}")
 
-def build_executable():
+def build_executable(noarchive=False, cython=False):
     """Build the executable using PyInstaller"""
     print("Building executable...")
     
-    # Change to parent directory (project root)
-    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    
     # Use the spec file if it exists, otherwise use direct command
     if os.path.exists('DBCUtility.spec'):
         cmd = [sys.executable, "-m", "PyInstaller", "DBCUtility.spec"]
@@ -74,9 +152,16 @@ def build_executable():
         else:
             data_sep = ":"
         
+        # --onedir avoids unpacking the whole bundle to a temp dir on every launch.
+        # Set PYINSTALLER_BUILD_ONEFILE=yes to get the old single-file build.
+        if onefile_requested():
+            bundle_args = ["--onefile"]
+        else:
+            bundle_args = ["--onedir"]
+        
         cmd = [
             sys.executable, "-m", "PyInstaller",
-            "--onefile",
+            *bundle_args,
             "--windowed",
             "--name=DBCUtility",
             "--icon=icons/app_icon.ico",
@@ -90,31 +175,74 @@ def build_executable():
             "--hidden-import=search_module",
             "--hidden-import=dbc_editor_ui",
             "--hidden-import=dbc_editor",
-            "main.py"
         ]
+        
+        if cython:
+            for module in CYTHON_HIDDEN_IMPORTS:
+                cmd.append(f"--hidden-import={module}")
+        
+        if noarchive:
+            # Keep bytecode as loose .pyc files instead of one archive (faster iterative builds)
+            cmd.append("--noarchive")
+        
+        upx_dir = check_upx()
+        if upx_dir:
+            cmd.append(f"--upx-dir={upx_dir}")
+            # These DLLs are known to break when UPX-compressed
+            for dll in ("vcruntime140.dll", "qwindows.dll", "Qt5WebEngineCore.dll"):
+                cmd.append(f"--upx-exclude={dll}")
+        
+        cmd.append("main.py")
+    
+    # Keep compiled bytecode outside build/ so it survives a --clean build
+    env = dict(os.environ)
+    env.setdefault("PYTHONPYCACHEPREFIX", str(PROJECT_ROOT / ".pycache"))
+    
+    if cython:
+        cythonize_modules()
     
     try:
-        subprocess.check_call(cmd)
+        subprocess.check_call(cmd, env=env)
         print("✓ Executable built successfully!")
+        print_dir_size('dist', "dist size")
         return True
     except subprocess.CalledProcessError as e:
         print(f"✗ Failed to build executable: {e}")
         return False
+    finally:
+        if cython:
+            remove_cython_output()
 
 def main():
+    parser = argparse.ArgumentParser(description="Build the DBCUtility executable")
+    parser.add_argument("--clean", action="store_true",
+                        help="also remove the PyInstaller build/ cache before building")
+    parser.add_argument("--noarchive", action="store_true",
+                        help="store bytecode as loose files instead of a single archive")
+    parser.add_argument("--cython", action="store_true",
+                        help="compile the hot GUI modules to C extensions with Cython first")
+    args = parser.parse_args()
+    
     print("=== DBCUtility Executable Builder ===")
     
+    # All paths below (build/, dist/, main.py, icons/) are relative to the project root
+    os.chdir(PROJECT_ROOT)
+    
     # Check if PyInstaller is available
     if not check_pyinstaller():
         sys.exit(1)
     
-    # Clean previous builds
-    clean_build_dirs()
+    # Clean previous builds (logging the old size to compare with the new one)
+    print_dir_size('dist', "previous dist size")
+    clean_build_dirs(clean=args.clean)
     
     # Build the executable
-    if build_executable():
+    if build_executable(noarchive=args.noarchive, cython=args.cython):
         print("\n=== Build Complete ===")
-        print("Executable location: dist/DBCUtility.exe")
+        if onefile_requested():
+            print("Executable location: dist/DBCUtility.exe")
+        else:
+            print("Executable location: dist/DBCUtility/DBCUtility.exe")
         print("You can now run the executable from the dist folder.")
     else:
         print("\n=== Build Failed ===")
@@ -5,11 +5,20 @@ Creates a folder-based distribution that works across Linux distributions.
 """
 
 import os
+import errno
 import sys
 import subprocess
 import shutil
-import platform
+import importlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+
+from dir_size import print_dir_size
+
+# Project root (parent of scripts/), resolved once at import time
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 def check_dependencies():
     """Check if required dependencies are installed"""
@@ -21,9 +30,18 @@ def check_dependencies():
     
     missing_packages = []
     
-    for package_name, import_name in package_imports.items():
+    # Import probes overlap well: most of their time is spent reading .pyc
+    # files from disk, which releases the GIL.
+    with ThreadPoolExecutor(max_workers=len(package_imports)) as executor:
+        futures = {
+            package_name: executor.submit(importlib.import_module, import_name)
+            for package_name, import_name in package_imports.items()
+        }
+    
+    # Report in the original order so the output is deterministic
+    for package_name in package_imports:
         try:
-            __import__(import_name)
+            futures[package_name].result()
             print(f"✓ {package_name} is installed")
         except ImportError:
             missing_packages.append(package_name)
@@ -40,47 +58,115 @@ def check_dependencies():
     
     return True
 
+def check_upx():
+    """Check if UPX is available for compressing the bundled libraries"""
+    upx_path = shutil.which("upx")
+    if upx_path:
+        print(f"✓ UPX found: {upx_path}")
+        return os.path.dirname(upx_path)
+    print("⚠️  UPX not found. Building without UPX compression.")
+    print("   Install it with your package manager (e.g. sudo apt install upx-ucl).")
+    return None
+
+# FICLONE ioctl request (linux/fs.h): share the source extents with the destination
+FICLONE = 0x40049409
+
+def _reflink_copy(src, dst):
+    """
+    Copy a file as a reflink (copy-on-write clone) where the filesystem supports it.
+    On btrfs/XFS this is a metadata-only operation; elsewhere fall back to shutil.copy2.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        import fcntl
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        shutil.copystat(src, dst)
+    except (ImportError, OSError):
+        # No fcntl (Windows), or EOPNOTSUPP/EXDEV/EINVAL from the filesystem
+        _sendfile_copy(src, dst)
+    return dst
+
+def _sendfile_copy(src, dst):
+    """
+    Copy a file with os.sendfile so the data never passes through userspace.
+    Falls back to shutil.copy2 where sendfile is unavailable or unsupported.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while os.sendfile(dst_fd, src_fd, None, 2 ** 20):
+                    pass
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        shutil.copystat(src, dst)
+    except (AttributeError, OSError) as e:
+        # No os.sendfile (Windows), or EINVAL/ENOSYS for non-regular files
+        if isinstance(e, OSError) and e.errno not in (errno.EINVAL, errno.ENOSYS):
+            raise
+        shutil.copy2(src, dst)
+    return dst
+
 def clean_build_dirs():
     """Clean previous build directories"""
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
     
     dirs_to_clean = ['build', 'dist', 'linuxBuilds']
     for dir_name in dirs_to_clean:
-        dir_path = project_root / dir_name
+        dir_path = PROJECT_ROOT / dir_name
         if dir_path.exists():
             print(f"Cleaning {dir_name} directory...")
             shutil.rmtree(dir_path)
             print(f"✓ Cleaned {dir_name}")
 
+@functools.lru_cache(maxsize=1)
 def get_system_info():
-    """Get system information for the build"""
+    """Get system information for the build (cached, read-only)"""
+    import platform
     system_info = {
         'platform': platform.system(),
         'architecture': platform.machine(),
         'python_version': platform.python_version(),
         'distribution': get_linux_distribution()
     }
-    return system_info
+    return MappingProxyType(system_info)
+
+def _read_release_file(path):
+    """Parse a shell-style KEY=value release file (e.g. /etc/os-release) into a dict"""
+    with open(path, 'r') as f:
+        return dict(line.strip().split('=', 1) for line in f if '=' in line)
 
+@functools.lru_cache(maxsize=1)
 def get_linux_distribution():
     """Get Linux distribution information"""
     try:
-        with open('/etc/os-release', 'r') as f:
-            lines = f.readlines()
-            for line in lines:
-                if line.startswith('PRETTY_NAME='):
-                    return line.split('=')[1].strip().strip('"')
-    except:
+        fields = _read_release_file('/etc/os-release')
+        name = fields.get('PRETTY_NAME', '').strip('"') or fields.get('NAME', '').strip('"')
+        if name:
+            return name
+    except OSError:
         pass
     
     try:
-        with open('/etc/lsb-release', 'r') as f:
-            lines = f.readlines()
-            for line in lines:
-                if line.startswith('DISTRIB_DESCRIPTION='):
-                    return line.split('=')[1].strip().strip('"')
-    except:
+        fields = _read_release_file('/etc/lsb-release')
+        name = fields.get('DISTRIB_DESCRIPTION', '').strip('"')
+        if name:
+            return name
+    except OSError:
         pass
     
     return "Unknown Linux Distribution"
@@ -89,11 +175,10 @@ def build_linux_package():
     """Build the Linux package using PyInstaller"""
     print("Building Linux package...")
     
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
     
     # Create linuxBuilds directory
-    linux_builds_dir = project_root / "linuxBuilds"
+    linux_builds_dir = PROJECT_ROOT / "linuxBuilds"
     linux_builds_dir.mkdir(exist_ok=True)
     
     # PyInstaller command for Linux
@@ -112,12 +197,19 @@ def build_linux_package():
         "--hidden-import=dbc_editor_ui",
         "--hidden-import=dbc_editor",
         "--name=DBCUtility",  # Name of the executable
-        "main.py"
+        "--strip",  # Strip debug symbols from bundled binaries
     ]
     
+    upx_dir = check_upx()
+    if upx_dir:
+        cmd.append(f"--upx-dir={upx_dir}")
+    
+    cmd.append("main.py")
+    
     try:
         subprocess.check_call(cmd)
         print("✓ PyInstaller build completed successfully!")
+        print_dir_size(PROJECT_ROOT / "dist", "dist size")
         return True
     except subprocess.CalledProcessError as e:
         print(f"✗ PyInstaller build failed: {e}")
@@ -127,9 +219,8 @@ def create_linux_distribution():
     """Create the final Linux distribution folder"""
     print("Creating Linux distribution...")
     
-    project_root = Path(__file__).parent.parent
-    dist_dir = project_root / "dist" / "DBCUtility"
-    linux_builds_dir = project_root / "linuxBuilds"
+    dist_dir = PROJECT_ROOT / "dist" / "DBCUtility"
+    linux_builds_dir = PROJECT_ROOT / "linuxBuilds"
     
     if not dist_dir.exists():
         print(f"✗ PyInstaller output not found: {dist_dir}")
@@ -145,7 +236,7 @@ def create_linux_distribution():
         shutil.rmtree(final_dist_dir)
     
     # Copy PyInstaller output
-    shutil.copytree(dist_dir, final_dist_dir)
+    shutil.copytree(dist_dir, final_dist_dir, copy_function=_reflink_copy)
     print(f"✓ Copied PyInstaller output to {final_dist_dir}")
     
     # Create launcher script
@@ -155,7 +246,7 @@ def create_linux_distribution():
     create_desktop_entry(final_dist_dir)
     
     # Copy documentation
-    copy_documentation(final_dist_dir, project_root)
+    copy_documentation(final_dist_dir, PROJECT_ROOT)
     
     # Create installation script
     create_install_script(final_dist_dir)
@@ -166,9 +257,17 @@ def create_linux_distribution():
     print(f"✓ Linux distribution created: {final_dist_dir}")
     return True
 
-def create_launcher_script(dist_dir):
-    """Create a launcher script for the application"""
-    launcher_content = """#!/bin/bash
+def _write_script(path, content, executable=False):
+    """Write a generated text file, creating it with its final permissions in one step"""
+    mode = 0o755 if executable else 0o644
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+# Launcher shell script placed next to the executable
+LAUNCHER_SCRIPT = """#!/bin/bash
 # DBC Utility Launcher Script
 
 # Get the directory where this script is located
@@ -193,18 +292,15 @@ fi
 cd "$SCRIPT_DIR"
 exec "$EXECUTABLE" "$@"
 """
-    
+
+def create_launcher_script(dist_dir):
+    """Create a launcher script for the application"""
     launcher_path = dist_dir / "launch-dbc-utility.sh"
-    with open(launcher_path, 'w') as f:
-        f.write(launcher_content)
-    
-    # Make launcher executable
-    os.chmod(launcher_path, 0o755)
+    _write_script(launcher_path, LAUNCHER_SCRIPT, executable=True)
     print(f"✓ Created launcher script: {launcher_path}")
 
-def create_desktop_entry(dist_dir):
-    """Create a desktop entry file"""
-    desktop_content = """[Desktop Entry]
+# Desktop entry shipped with the distribution
+DESKTOP_ENTRY = """[Desktop Entry]
 Version=1.0
 Type=Application
 Name=DBC Utility
@@ -217,10 +313,11 @@ Categories=Development;Engineering;Electronics;
 Keywords=CAN;DBC;Database;Automotive;Engineering;
 StartupWMClass=DBCUtility
 """
-    
+
+def create_desktop_entry(dist_dir):
+    """Create a desktop entry file"""
     desktop_path = dist_dir / "DBCUtility.desktop"
-    with open(desktop_path, 'w') as f:
-        f.write(desktop_content)
+    _write_script(desktop_path, DESKTOP_ENTRY)
     print(f"✓ Created desktop entry: {desktop_path}")
 
 def copy_documentation(dist_dir, project_root):
@@ -230,12 +327,11 @@ def copy_documentation(dist_dir, project_root):
     for doc in docs_to_copy:
         src_path = project_root / doc
         if src_path.exists():
-            shutil.copy2(src_path, dist_dir)
+            _reflink_copy(src_path, dist_dir)
             print(f"✓ Copied {doc}")
 
-def create_install_script(dist_dir):
-    """Create installation script"""
-    install_content = """#!/bin/bash
+# System-wide installation script
+INSTALL_SCRIPT = """#!/bin/bash
 # DBC Utility Installation Script
 
 set -e
@@ -286,17 +382,15 @@ echo "You can now find it in your applications menu."
 echo ""
 echo "To uninstall, run: $INSTALL_DIR/uninstall.sh"
 """
-    
+
+def create_install_script(dist_dir):
+    """Create installation script"""
     install_path = dist_dir / "install.sh"
-    with open(install_path, 'w') as f:
-        f.write(install_content)
-    
-    os.chmod(install_path, 0o755)
+    _write_script(install_path, INSTALL_SCRIPT, executable=True)
     print(f"✓ Created installation script: {install_path}")
 
-def create_uninstall_script(dist_dir):
-    """Create uninstall script"""
-    uninstall_content = """#!/bin/bash
+# Uninstall script
+UNINSTALL_SCRIPT = """#!/bin/bash
 # DBC Utility Uninstall Script
 
 set -e
@@ -326,17 +420,15 @@ update-desktop-database "$DESKTOP_DIR" 2>/dev/null || true
 echo ""
 echo "✓ DBC Utility uninstalled successfully!"
 """
-    
+
+def create_uninstall_script(dist_dir):
+    """Create uninstall script"""
     uninstall_path = dist_dir / "uninstall.sh"
-    with open(uninstall_path, 'w') as f:
-        f.write(uninstall_content)
-    
-    os.chmod(uninstall_path, 0o755)
+    _write_script(uninstall_path, UNINSTALL_SCRIPT, executable=True)
     print(f"✓ Created uninstall script: {uninstall_path}")
 
-def create_readme(dist_dir):
-    """Create Linux-specific README"""
-    readme_content = """# DBC Utility for Linux
+# Linux-specific README
+LINUX_README = """# DBC Utility for Linux
 
 ## Installation
 
@@ -397,10 +489,11 @@ If the application doesn't appear in your applications menu:
 
 For issues and support, please refer to the main README.md file.
 """
-    
+
+def create_readme(dist_dir):
+    """Create Linux-specific README"""
     readme_path = dist_dir / "README-Linux.md"
-    with open(readme_path, 'w') as f:
-        f.write(readme_content)
+    _write_script(readme_path, LINUX_README)
     print(f"✓ Created Linux README: {readme_path}")
 
 def main():
@@ -411,20 +504,21 @@ def main():
         sys.exit(1)
     
     # Get system info
-    system_info = get_system_info()
+    sys_info = get_system_info()
     print(f"\nSystem Information:")
-    print(f"  Platform: {system_info['platform']}")
-    print(f"  Architecture: {system_info['architecture']}")
-    print(f"  Python Version: {system_info['python_version']}")
-    print(f"  Distribution: {system_info['distribution']}")
+    print(f"  Platform: {sys_info['platform']}")
+    print(f"  Architecture: {sys_info['architecture']}")
+    print(f"  Python Version: {sys_info['python_version']}")
+    print(f"  Distribution: {sys_info['distribution']}")
     
-    if system_info['platform'] != 'Linux':
+    if sys_info['platform'] != 'Linux':
         print("⚠️  Warning: This script is designed for Linux systems")
         response = input("Continue anyway? (y/N): ")
         if response.lower() != 'y':
             sys.exit(1)
     
-    # Clean previous builds
+    # Clean previous builds (logging the old size to compare with the new one)
+    print_dir_size(PROJECT_ROOT / "dist", "previous dist size")
     clean_build_dirs()
     
     # Build the package
@@ -436,11 +530,9 @@ def main():
         sys.exit(1)
     
     # Create Linux-specific README
-    project_root = Path(__file__).parent.parent
-    system_info = get_system_info()
-    arch = system_info['architecture']
+    arch = sys_info['architecture']
     dist_name = f"DBCUtility-Linux-{arch}"
-    final_dist_dir = project_root / "linuxBuilds" / dist_name
+    final_dist_dir = PROJECT_ROOT / "linuxBuilds" / dist_name
     create_readme(final_dist_dir)
     
     print("\n=== Build Complete ===")
@@ -9,6 +9,49 @@ import sys
 import zipfile
 from datetime import datetime
 
+# Already-compressed files, stored as-is: deflating them again costs CPU for
+# almost no size saving. The onedir bundle's .dll/.pyd/.so files are plain
+# PE/ELF libraries (UPX is optional) and are deflated like everything else.
+STORED_SUFFIXES = ('.zip',)
+
+def iter_files(root):
+    """Yield a DirEntry for every file under root, in sorted (deterministic) order"""
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_files(entry.path)
+        elif entry.is_file():
+            yield entry
+
+def is_onefile_exe(path):
+    """
+    Return True for a single-file build's executable (PYINSTALLER_BUILD_ONEFILE=yes),
+    which carries the compressed PyInstaller archive. A onedir launcher sits next
+    to its _internal folder and is only a small bootloader.
+    """
+    return (path.lower().endswith('.exe')
+            and not os.path.isdir(os.path.join(os.path.dirname(path), '_internal')))
+
+def get_compress_type(path):
+    """Pick the zip compression method for a file: stored if already compressed, else deflated"""
+    if path.lower().endswith(STORED_SUFFIXES) or is_onefile_exe(path):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+def zip_directory(release_dir, zip_filename):
+    """
+    Write every file under release_dir into zip_filename (paths relative to release_dir).
+    Also used by release.py. Returns the number of files added.
+    """
+    count = 0
+    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for entry in iter_files(release_dir):
+            arcname = os.path.relpath(entry.path, release_dir).replace(os.sep, '/')
+            zipf.write(entry.path, arcname, compress_type=get_compress_type(entry.path))
+            count += 1
+    return count
+
 def create_zip_package(version):
     """Create a zip package for the release"""
     print(f"=== Creating Zip Package for v{version} ===")
@@ -26,15 +69,9 @@ def create_zip_package(version):
     
     # Create zip file
     try:
-        with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add all files from release directory
-            for root, dirs, files in os.walk(release_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    # Add file to zip with relative path
-                    arcname = os.path.relpath(file_path, release_dir)
-                    zipf.write(file_path, arcname)
-                    print(f"✓ Added: {arcname}")
+        # Add all files from release directory
+        count = zip_directory(release_dir, zip_filename)
+        print(f"✓ Added {count} files to zip")
         
         # Get file size
         file_size = os.path.getsize(zip_filename)
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Shared by the build scripts: measure the size of the PyInstaller output
+"""
+
+import os
+
+def get_dir_size(path):
+    """Return the total size in bytes of all files under path (symlinks are not counted)"""
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for file in files:
+            file_path = os.path.join(root, file)
+            if not os.path.islink(file_path):
+                total += os.path.getsize(file_path)
+    return total
+
+def print_dir_size(path, label):
+    """Print the size of path in MB as '✓ <label>: ...', if it exists"""
+    if os.path.isdir(path):
+        size_mb = get_dir_size(path) / (1024 * 1024)
+        print(f"✓ {label}: {size_mb:.1f} MB")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shared by the release scripts: read the project version from pyproject.toml
+"""
+
+import re
+import sys
+from pathlib import Path
+
+PYPROJECT_PATH = Path(__file__).resolve().parent.parent / "pyproject.toml"
+
+# Used when neither tomllib (Python 3.11+) nor tomli is available: the first
+# version = "x.y.z" line, which is the one in [project]
+_VERSION_RE = re.compile(r'^version\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+
+def _load_toml(pyproject_path):
+    """Parse pyproject.toml, or return None if no TOML parser is installed"""
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return None
+    with open(pyproject_path, 'rb') as f:
+        return tomllib.load(f)
+
+def get_version(pyproject_path=PYPROJECT_PATH):
+    """Get current version from pyproject.toml; exits with an error message if it cannot be read"""
+    try:
+        if not pyproject_path.exists():
+            print(f"Error: pyproject.toml not found at {pyproject_path}")
+            sys.exit(1)
+        
+        data = _load_toml(pyproject_path)
+        if data is None:
+            match = _VERSION_RE.search(pyproject_path.read_text(encoding='utf-8'))
+            version = match.group(1) if match else None
+        else:
+            version = data.get("project", {}).get("version")
+            if version is None:
+                version = data.get("tool", {}).get("poetry", {}).get("version")
+        if version is None:
+            print(f"Error: no [project] version found in {pyproject_path}")
+            sys.exit(1)
+        return version
+    except Exception as e:
+        print(f"Error reading version from pyproject.toml: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    print(get_version())
@@ -7,79 +7,146 @@ Automates the release process including building and versioning.
 
 import os
 import sys
-import subprocess
-import shutil
-import re
-from datetime import datetime
-from pathlib import Path
-
-def get_version():
-    """Get current version from pyproject.toml"""
-    try:
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        pyproject_path = Path(project_root) / "pyproject.toml"
-        
-        if pyproject_path.exists():
-            with open(pyproject_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Look for version = "x.y.z" pattern
-                match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                if match:
-                    return match.group(1)
-        
-        print(f"Error: pyproject.toml not found at {pyproject_path}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading version from pyproject.toml: {e}")
-        sys.exit(1)
 
-def build_release():
-    """Build the release executable"""
+from project_version import get_version
+
+# subprocess, shutil, datetime and create_zip are imported inside the functions
+# that need them so that `release.py --show-version` stays fast.
+
+def _clone_copy(src, dst):
+    """
+    Copy a file letting the OS clone it where the filesystem supports it.
+    On Windows, CopyFileW block-clones on ReFS / Dev Drive volumes.
+    """
+    import shutil
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if sys.platform == "win32":
+        import ctypes
+        copy_file = ctypes.windll.kernel32.CopyFileW
+        if copy_file(str(src), str(dst), False):
+            shutil.copystat(src, dst)
+            return dst
+    shutil.copy2(src, dst)
+    return dst
+
+def is_build_noise(line):
+    """Return True for PyInstaller's per-module INFO log lines (e.g. '1234 INFO: Analyzing ...')"""
+    parts = line.split(' ', 2)
+    return len(parts) >= 2 and parts[0].isdigit() and parts[1] == 'INFO:'
+
+def build_release(version=None):
+    """
+    Build the release executable.
+    If version is given, the release directory and notes are prepared while
+    PyInstaller runs.
+    """
+    import subprocess
     print("=== Building Release Executable ===")
     
     # Change to project root
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     os.chdir(project_root)
     
-    # Run build script
+    env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+    
+    # Run build script, streaming its output
     try:
-        subprocess.run([sys.executable, "scripts/build_exe.py"], check=True)
-        print("✓ Build completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
+        proc = subprocess.Popen(
+            [sys.executable, "scripts/build_exe.py"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            env=env,
+        )
+    except OSError as e:
         print(f"✗ Build failed: {e}")
         return False
-
-def create_release_package(version):
-    """Create release package with versioned executable"""
-    print(f"=== Creating Release Package v{version} ===")
     
-    # Create release directory
+    # Overlap the release directory setup with the build
+    if version:
+        prepare_release_dir(version)
+    
+    # Only show warnings, errors and the build script's own messages
+    for line in proc.stdout:
+        if not is_build_noise(line):
+            print(line, end='')
+    
+    returncode = proc.wait()
+    if returncode != 0:
+        print(f"✗ Build failed: build_exe.py exited with status {returncode}")
+        return False
+    
+    print("✓ Build completed successfully")
+    return True
+
+def prepare_release_dir(version):
+    """Create an empty release directory containing the release notes"""
+    import shutil
     release_dir = f"release-v{version}"
     if os.path.exists(release_dir):
         shutil.rmtree(release_dir)
     os.makedirs(release_dir)
     
-    # Copy executable with version
-    exe_source = "dist/DBCUtility.exe"
-    exe_dest = f"{release_dir}/DBCUtility-v{version}.exe"
+    create_release_notes(release_dir, version)
+    return release_dir
+
+def copy_application(release_dir, version):
+    """Copy the built application folder into the release directory"""
+    import shutil
+    app_source = "dist/DBCUtility"
+    app_dest = f"{release_dir}/DBCUtility-v{version}"
+    onefile_source = "dist/DBCUtility.exe"
     
-    if os.path.exists(exe_source):
-        shutil.copy2(exe_source, exe_dest)
-        print(f"✓ Copied executable: DBCUtility-v{version}.exe")
+    if os.path.isdir(app_source):
+        shutil.copytree(app_source, app_dest, copy_function=_clone_copy)
+        print(f"✓ Copied application folder: DBCUtility-v{version}/")
+    elif os.path.exists(onefile_source):
+        # Single-file build (PYINSTALLER_BUILD_ONEFILE=yes)
+        os.makedirs(app_dest)
+        _clone_copy(onefile_source, f"{app_dest}/DBCUtility.exe")
+        print(f"✓ Copied executable: DBCUtility-v{version}/DBCUtility.exe")
     else:
-        print(f"✗ Executable not found: {exe_source}")
+        print(f"✗ Build output not found: {app_source}")
         return False
-    
-    # Copy README and LICENSE
+    return True
+
+def copy_documentation(release_dir):
+    """Copy README, LICENSE and CHANGELOG into the release directory"""
     files_to_copy = ['README.md', 'LICENSE', 'CHANGELOG.md']
     for file in files_to_copy:
         if os.path.exists(file):
-            shutil.copy2(file, release_dir)
+            _clone_copy(file, release_dir)
             print(f"✓ Copied {file}")
+
+def create_release_package(version):
+    """Create release package with versioned executable"""
+    from concurrent.futures import ThreadPoolExecutor, wait
+    print(f"=== Creating Release Package v{version} ===")
     
-    # Create release notes
-    create_release_notes(release_dir, version)
+    # Create release directory (unless it was prepared during the build)
+    release_dir = f"release-v{version}"
+    notes_pending = not os.path.isdir(release_dir)
+    if notes_pending:
+        os.makedirs(release_dir)
+    
+    # The application copy is I/O bound and dominates; run the small
+    # documentation/notes steps alongside it
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        app_future = executor.submit(copy_application, release_dir, version)
+        futures = [app_future, executor.submit(copy_documentation, release_dir)]
+        if notes_pending:
+            futures.append(executor.submit(create_release_notes, release_dir, version))
+        wait(futures)
+    
+    # Re-raise any error from the workers
+    for future in futures:
+        future.result()
+    if not app_future.result():
+        return False
     
     # Create zip package
     create_zip_package(release_dir, version)
@@ -89,6 +156,7 @@ def create_release_package(version):
 
 def create_release_notes(release_dir, version):
     """Create release notes file"""
+    from datetime import datetime
     release_notes = f"""DBC Utility v{version} Release Notes
 
 Release Date: {datetime.now().strftime('%Y-%m-%d')}
@@ -112,8 +180,8 @@ This is the initial release of DBC Utility, a comprehensive CAN database editor.
 - No additional dependencies required (standalone executable)
 
 ### Installation
-1. Download DBCUtility-v{version}.exe
-2. Run the executable directly
+1. Download and extract DBCUtility-v{version}.zip
+2. Run DBCUtility.exe from the DBCUtility-v{version} folder
 3. No installation required
 
 ### Usage
@@ -145,16 +213,10 @@ def create_zip_package(release_dir, version):
     
     # Create zip file
     try:
-        import zipfile
-        with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add all files from release directory
-            for root, dirs, files in os.walk(release_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    # Add file to zip with relative path
-                    arcname = os.path.relpath(file_path, release_dir)
-                    zipf.write(file_path, arcname)
-                    print(f"✓ Added to zip: {arcname}")
+        from create_zip import zip_directory
+        # Add all files from release directory
+        count = zip_directory(release_dir, zip_filename)
+        print(f"✓ Added {count} files to zip")
         
         # Get file size
         file_size = os.path.getsize(zip_filename)
@@ -168,6 +230,11 @@ def create_zip_package(release_dir, version):
 
 def main():
     """Main release process"""
+    # Fast path: print the version without importing the build machinery
+    if "--show-version" in sys.argv[1:]:
+        print(get_version())
+        return
+    
     print("=== DBC Utility Release Process ===")
     
     # Get current version
@@ -175,7 +242,7 @@ def main():
     print(f"Current version: {version}")
     
     # Build executable
-    if not build_release():
+    if not build_release(version):
         sys.exit(1)
     
     # Create release package
@@ -184,6 +251,7 @@ def main():
     
     print(f"\n=== Release v{version} Complete ===")
     print(f"Release package: release-v{version}/")
+    print(f"Executable location: release-v{version}/DBCUtility-v{version}/DBCUtility.exe")
     print("Next steps:")
     print("1. Test the release executable")
     print("2. Create a GitHub release")
@@ -5,61 +5,111 @@ Creates a complete Linux release package with versioning.
 """
 
 import os
+import errno
 import sys
 import subprocess
 import shutil
 import tarfile
+import gzip
+import io
+import stat
 import platform
-import re
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-def get_version():
-    """Get current version from pyproject.toml"""
-    try:
-        project_root = Path(__file__).parent.parent
-        pyproject_path = project_root / "pyproject.toml"
-        
-        if pyproject_path.exists():
-            with open(pyproject_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Look for version = "x.y.z" pattern
-                match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                if match:
-                    return match.group(1)
-        
-        print(f"Error: pyproject.toml not found at {pyproject_path}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading version from pyproject.toml: {e}")
-        sys.exit(1)
+from project_version import get_version
+
+# Project root (parent of scripts/), resolved once at import time
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LINUX_BUILDS_DIR = PROJECT_ROOT / "linuxBuilds"
 
-def build_linux_release():
-    """Build the Linux release"""
+def build_linux_release(use_subprocess=False):
+    """
+    Build the Linux release.
+    build_linux.py runs in this interpreter unless use_subprocess is set
+    (--subprocess), which is handy when debugging the build in isolation.
+    """
     print("=== Building Linux Release ===")
     
     # Change to project root
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
+    
+    if use_subprocess:
+        # Run Linux build script
+        try:
+            subprocess.run([sys.executable, "scripts/build_linux.py"], check=True)
+            print("✓ Linux build completed successfully")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"✗ Linux build failed: {e}")
+            return False
     
-    # Run Linux build script
+    scripts_dir = str(PROJECT_ROOT / "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
     try:
-        subprocess.run([sys.executable, "scripts/build_linux.py"], check=True)
-        print("✓ Linux build completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
+        from build_linux import main as build_main
+        build_main()
+    except SystemExit as e:
+        # build_linux.main() reports failures with sys.exit(1)
+        if e.code:
+            print(f"✗ Linux build failed: exit status {e.code}")
+            return False
+    except Exception as e:
         print(f"✗ Linux build failed: {e}")
         return False
+    finally:
+        os.chdir(PROJECT_ROOT)
+    
+    print("✓ Linux build completed successfully")
+    return True
+
+def _fast_copy(src, dst):
+    """
+    Copy a file in the kernel with os.copy_file_range (Linux), then copy its metadata.
+    Falls back to shutil.copy2 where copy_file_range is unavailable or refuses the pair.
+    """
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        shutil.copystat(src, dst)
+    except (AttributeError, OSError) as e:
+        # No os.copy_file_range (non-Linux), or EXDEV/ENOSYS/EINVAL/EOPNOTSUPP
+        if isinstance(e, OSError) and e.errno not in (errno.EXDEV, errno.ENOSYS,
+                                                      errno.EINVAL, errno.EOPNOTSUPP):
+            raise
+        shutil.copy2(src, dst)
+    return dst
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst so no file data is rewritten; copy across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # EXDEV (different filesystem) or a filesystem without hardlinks
+        _fast_copy(src, dst)
+    return dst
 
 def create_linux_release_package(version):
     """Create Linux release package with versioning"""
     print(f"=== Creating Linux Release Package v{version} ===")
     
-    project_root = Path(__file__).parent.parent
-    linux_builds_dir = project_root / "linuxBuilds"
-    
     # Find the Linux distribution folder
-    dist_folders = list(linux_builds_dir.glob("DBCUtility-Linux-*"))
+    dist_folders = list(LINUX_BUILDS_DIR.glob("DBCUtility-Linux-*"))
     if not dist_folders:
         print("✗ No Linux distribution found. Run build_linux.py first.")
         return False
@@ -67,33 +117,50 @@ def create_linux_release_package(version):
     dist_folder = dist_folders[0]  # Take the first one
     arch = dist_folder.name.split('-')[-1]
     
-    # Create release directory
-    release_dir = project_root / f"release-linux-v{version}"
-    if release_dir.exists():
-        shutil.rmtree(release_dir)
-    release_dir.mkdir()
+    # Create release directory (kept between runs; its outputs are rewritten
+    # in place and anything this run did not produce is pruned below)
+    release_dir = PROJECT_ROOT / f"release-linux-v{version}"
+    release_dir.mkdir(exist_ok=True)
     
-    # Create versioned distribution folder
+    # The versioned folder only exists inside the tarball; the build output is
+    # streamed straight into it rather than copied into the release first
     versioned_dist_name = f"DBCUtility-Linux-{arch}-v{version}"
-    versioned_dist_dir = release_dir / versioned_dist_name
-    
-    # Copy the distribution
-    shutil.copytree(dist_folder, versioned_dist_dir)
-    print(f"✓ Copied distribution: {versioned_dist_name}")
     
     # Create release notes
-    create_linux_release_notes(release_dir, version, arch)
-    create_combined_release_notes(release_dir, version)
+    produced = [
+        create_linux_release_notes(release_dir, version, arch),
+        create_combined_release_notes(release_dir, version),
+    ]
     
-    # Create tar.gz package
-    create_tar_package(release_dir, versioned_dist_name, version)
+    # Create tar.gz package straight from the build output
+    produced.append(create_tar_package(release_dir, versioned_dist_name, version, src=dist_folder))
     
     # Create AppImage (if possible)
-    create_appimage_package(versioned_dist_dir, version, arch)
+    appimage_path = create_appimage_package(dist_folder, version, arch, release_dir)
+    if appimage_path:
+        produced.append(appimage_path)
+    
+    prune_stale_artifacts(release_dir, produced)
     
     print(f"✓ Linux release package created: {release_dir}/")
     return True
 
+def prune_stale_artifacts(release_dir, produced):
+    """
+    Delete everything at the top of release_dir that is not in produced: files
+    from earlier runs (an AppImage this machine cannot build, another arch's
+    tarball, an old checksums.txt) would otherwise be shipped and checksummed.
+    """
+    keep = {Path(p).name for p in produced}
+    with os.scandir(release_dir) as it:
+        stale = [entry for entry in it if entry.name not in keep]
+    for entry in stale:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.remove(entry.path)
+        print(f"✓ Removed stale {entry.name}")
+
 def create_linux_release_notes(release_dir, version, arch):
     """Create Linux-specific release notes"""
     release_notes = f"""# DBC Utility Linux v{version} Release Notes
@@ -176,31 +243,106 @@ For issues and support, please refer to the main README.md file or create an iss
 """
     
     release_notes_path = release_dir / f"RELEASE_NOTES_Linux_v{version}.md"
-    with open(release_notes_path, 'w') as f:
-        f.write(release_notes)
+    release_notes_path.write_text(release_notes, encoding='utf-8')
     print(f"✓ Created release notes: {release_notes_path}")
+    return release_notes_path
+
+# Buffer size for reading members and writing the compressed stream
+TAR_BUFSIZE = 2 * 1024 * 1024
 
-def create_tar_package(release_dir, dist_name, version):
-    """Create tar.gz package"""
+# gzip level 6 is several times faster than tarfile's default of 9 for a
+# size difference of well under 1%; override with DBC_GZIP_LEVEL in CI
+DEFAULT_GZIP_LEVEL = 6
+
+def get_gzip_level():
+    """Return DBC_GZIP_LEVEL (default 6); exits with an error unless it is an integer from 1 to 9"""
+    value = os.environ.get("DBC_GZIP_LEVEL", str(DEFAULT_GZIP_LEVEL))
+    try:
+        level = int(value)
+    except ValueError:
+        level = None
+    if level is None or not 1 <= level <= 9:
+        print(f"✗ Invalid DBC_GZIP_LEVEL={value!r}: expected an integer from 1 to 9")
+        sys.exit(1)
+    return level
+
+def _add_tree(tar, path, arcname, st=None):
+    """
+    Add a directory tree to tar, building each TarInfo from the os.scandir
+    entry's stat instead of letting tarfile lstat (and look up owner names
+    for) every member again.
+    """
+    st = st or os.lstat(path)
+    info = tarfile.TarInfo(arcname)
+    info.mode = stat.S_IMODE(st.st_mode)
+    info.mtime = st.st_mtime
+    info.uid, info.gid = st.st_uid, st.st_gid
+    
+    if stat.S_ISDIR(st.st_mode):
+        info.type = tarfile.DIRTYPE
+        tar.addfile(info)
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            _add_tree(tar, entry.path, f"{arcname}/{entry.name}",
+                      entry.stat(follow_symlinks=False))
+    elif stat.S_ISLNK(st.st_mode):
+        info.type = tarfile.SYMTYPE
+        info.linkname = os.readlink(path)
+        tar.addfile(info)
+    elif stat.S_ISREG(st.st_mode):
+        info.size = st.st_size
+        with open(path, 'rb') as f:
+            tar.addfile(info, f)
+
+def create_tar_package(release_dir, dist_name, version, src=None):
+    """Create tar.gz package of src (defaults to release_dir/dist_name), stored as dist_name"""
     print("Creating tar.gz package...")
     
     tar_filename = f"{dist_name}.tar.gz"
     tar_path = release_dir / tar_filename
     
-    with tarfile.open(tar_path, "w:gz") as tar:
-        tar.add(release_dir / dist_name, arcname=dist_name)
+    source = src or release_dir / dist_name
+    level = get_gzip_level()
+    
+    pigz = shutil.which("pigz")
+    if pigz:
+        # Stream the tar through pigz, which compresses on all cores
+        with open(tar_path, "wb") as raw:
+            proc = subprocess.Popen([pigz, f"-{level}", "-p", str(os.cpu_count() or 1)],
+                                    stdin=subprocess.PIPE, stdout=raw)
+            try:
+                with tarfile.open(fileobj=proc.stdin, mode="w|", bufsize=TAR_BUFSIZE) as tar:
+                    _add_tree(tar, source, dist_name)
+            finally:
+                proc.stdin.close()
+                returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, pigz)
+        print(f"✓ Created tar.gz package with pigz: {tar_filename}")
+        return tar_path
+    
+    # Open the gzip and tar layers separately so both can use a large buffer
+    # instead of tarfile's 16 KiB default
+    with open(tar_path, "wb") as raw, \
+         gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=level) as gz, \
+         io.BufferedWriter(gz, buffer_size=TAR_BUFSIZE) as buf, \
+         tarfile.open(fileobj=buf, mode="w", copybufsize=TAR_BUFSIZE) as tar:
+        _add_tree(tar, source, dist_name)
     
     print(f"✓ Created tar.gz package: {tar_filename}")
+    return tar_path
 
-def create_appimage_package(dist_dir, version, arch):
-    """Create AppImage package if appimagetool is available"""
+def create_appimage_package(dist_dir, version, arch, output_dir):
+    """
+    Create AppImage package of dist_dir in output_dir if appimagetool is available.
+    Returns the AppImage path, or None if none was created.
+    """
     print("Attempting to create AppImage...")
     
     # Check if appimagetool is available
-    try:
-        subprocess.run(["appimagetool", "--version"], 
-                      capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    appimagetool = shutil.which("appimagetool")
+    if not appimagetool:
         print("⚠️  appimagetool not found. Skipping AppImage creation.")
         print("   To create AppImage, install appimagetool:")
         print("   wget https://github.com/AppImage/AppImageKit/releases/download/continuous/appimagetool-x86_64.AppImage")
@@ -210,12 +352,12 @@ def create_appimage_package(dist_dir, version, arch):
     
     try:
         # Create AppDir structure
-        appdir = dist_dir.parent / f"DBCUtility.AppDir"
+        appdir = output_dir / f"DBCUtility.AppDir"
         if appdir.exists():
             shutil.rmtree(appdir)
         
         # Copy application to AppDir
-        shutil.copytree(dist_dir, appdir / "usr" / "bin" / "DBCUtility")
+        shutil.copytree(dist_dir, appdir / "usr" / "bin" / "DBCUtility", copy_function=_link_or_copy)
         
         # Create AppRun script
         apprun_content = """#!/bin/bash
@@ -223,9 +365,8 @@ cd "$(dirname "$0")"
 exec ./usr/bin/DBCUtility/DBCUtility "$@"
 """
         apprun_path = appdir / "AppRun"
-        with open(apprun_path, 'w') as f:
-            f.write(apprun_content)
-        os.chmod(apprun_path, 0o755)
+        apprun_path.write_text(apprun_content, encoding='utf-8')
+        apprun_path.chmod(0o755)
         
         # Create desktop entry for AppImage
         desktop_content = """[Desktop Entry]
@@ -240,8 +381,7 @@ Categories=Development;Engineering;
 """
         desktop_path = appdir / "usr" / "share" / "applications" / "DBCUtility.desktop"
         desktop_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(desktop_path, 'w') as f:
-            f.write(desktop_content)
+        desktop_path.write_text(desktop_content, encoding='utf-8')
         
         # Copy icon - try multiple possible locations
         icon_path = appdir / "usr" / "share" / "icons" / "hicolor" / "256x256" / "apps"
@@ -251,7 +391,7 @@ Categories=Development;Engineering;
         possible_icon_sources = [
             dist_dir / "icons" / "app_icon.png",
             dist_dir / "app_icon.png",
-            Path(__file__).parent.parent / "icons" / "app_icon.png"
+            PROJECT_ROOT / "icons" / "app_icon.png"
         ]
         
         icon_found = False
@@ -268,15 +408,27 @@ Categories=Development;Engineering;
         
         # Create AppImage
         appimage_name = f"DBCUtility-Linux-{arch}-v{version}.AppImage"
-        appimage_path = dist_dir.parent / appimage_name
+        appimage_path = output_dir / appimage_name
         
+        # Only stderr is kept (for the failure message); ARCH saves appimagetool
+        # from detecting the architecture itself
         subprocess.run([
-            "appimagetool", 
+            appimagetool, 
             str(appdir), 
             str(appimage_path)
-        ], check=True)
+        ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            text=True, env={**os.environ, "ARCH": arch})
         print(f"✓ Created AppImage: {appimage_name}")
         
+        # The AppDir is only staging for appimagetool; don't ship (or checksum) it
+        shutil.rmtree(appdir)
+        return appimage_path
+        
+    except subprocess.CalledProcessError as e:
+        print(f"✗ AppImage creation failed: {e}")
+        if e.stderr:
+            print(e.stderr.rstrip())
+        print("   Continuing with tar.gz distribution only...")
     except Exception as e:
         print(f"✗ AppImage creation failed: {e}")
         print("   Continuing with tar.gz distribution only...")
@@ -298,7 +450,7 @@ def create_combined_release_notes(release_dir, version):
 
 ### Windows
 1. Download and extract `DBCUtility-Windows-v{version}.zip`
-2. Run `DBCUtility.exe`
+2. Run `DBCUtility.exe` from the `DBCUtility-v{version}` folder
 
 ### Linux
 1. Download and extract `DBCUtility-Linux-x86_64-v{version}.tar.gz`
@@ -316,7 +468,7 @@ def create_combined_release_notes(release_dir, version):
 ## Platform-Specific Features
 
 ### Windows
-- Single-file executable
+- Self-contained application folder (`DBCUtility-v{version}/DBCUtility.exe`)
 - No installation required
 - Windows 10/11 compatible
 - Automatic dependency bundling
@@ -349,41 +501,99 @@ For issues and support, please create an issue on the project repository.
 """
     
     combined_notes_path = release_dir / f"RELEASE_NOTES_Combined_v{version}.md"
-    with open(combined_notes_path, 'w') as f:
-        f.write(combined_notes)
+    combined_notes_path.write_text(combined_notes, encoding='utf-8')
     print(f"✓ Created combined release notes: {combined_notes_path}")
+    return combined_notes_path
+
+# Checksum algorithm for checksums.txt; DBC_HASH=blake2b is faster than
+# SHA-256 on build machines without SHA instructions
+HASH_ALGO = os.environ.get("DBC_HASH", "sha256")
+
+# Supported DBC_HASH values: (name written to checksums.txt, command that verifies it)
+HASH_ALGOS = {
+    "sha256": ("sha256", "sha256sum -c checksums.txt"),
+    "blake2b": ("blake2b-256", "b2sum -l 256 -c checksums.txt"),
+}
+
+def check_hash_algo():
+    """Exit with an error unless DBC_HASH names a supported algorithm"""
+    if HASH_ALGO not in HASH_ALGOS:
+        print(f"✗ Unsupported DBC_HASH={HASH_ALGO!r}: expected one of {', '.join(HASH_ALGOS)}")
+        sys.exit(1)
+
+def _new_hash(algo):
+    """Return a fresh hash object for algo (BLAKE2b is truncated to 256 bits)"""
+    if algo == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.new(algo)
+
+def hash_file(path, algo=HASH_ALGO):
+    """Return the hex digest of a file without reading it into memory at once"""
+    with open(path, 'rb') as file:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(file, lambda: _new_hash(algo)).hexdigest()
+        h = _new_hash(algo)
+        buf = bytearray(1024 * 1024)
+        view = memoryview(buf)
+        while True:
+            n = file.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+        return h.hexdigest()
+
+def iter_files(root):
+    """Yield a DirEntry for every file under root, in sorted (deterministic) order"""
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        # follow_symlinks=False answers from the cached d_type without a stat
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_files(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry
 
 def create_checksums(release_dir):
     """Create checksums for all files"""
     print("Creating checksums...")
     
     checksums_file = release_dir / "checksums.txt"
-    with open(checksums_file, 'w') as f:
-        f.write(f"# DBC Utility Linux Release Checksums\n")
-        f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        for file_path in release_dir.rglob("*"):
-            if file_path.is_file() and file_path.name != "checksums.txt":
-                try:
-                    import hashlib
-                    with open(file_path, 'rb') as file:
-                        sha256_hash = hashlib.sha256(file.read()).hexdigest()
-                    relative_path = file_path.relative_to(release_dir)
-                    f.write(f"{sha256_hash}  {relative_path}\n")
-                except Exception as e:
-                    print(f"Warning: Could not create checksum for {file_path}: {e}")
+    file_paths = [entry.path for entry in iter_files(release_dir)
+                  if entry.name != "checksums.txt"]
+    
+    # hashlib releases the GIL while hashing, so the files hash in parallel
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {path: executor.submit(hash_file, path) for path in file_paths}
+    
+    lines = []
+    for file_path, future in futures.items():
+        try:
+            relative_path = os.path.relpath(file_path, release_dir)
+            lines.append(f"{future.result()}  {relative_path}")
+        except Exception as e:
+            print(f"Warning: Could not create checksum for {file_path}: {e}")
+    
+    algo_name, verify_cmd = HASH_ALGOS[HASH_ALGO]
+    header = (f"# DBC Utility Linux Release Checksums ({algo_name})\n"
+              f"# Verify with: {verify_cmd}\n"
+              f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    checksums_file.write_text(header + "\n".join(lines) + "\n", encoding='utf-8')
     
     print(f"✓ Created checksums: {checksums_file}")
 
 def main():
     print("=== DBC Utility Linux Release Builder ===")
     
+    # Reject a bad DBC_HASH / DBC_GZIP_LEVEL now rather than after the build
+    check_hash_algo()
+    get_gzip_level()
+    
     # Get version
     version = get_version()
     print(f"Building release for version: {version}")
     
     # Build Linux release
-    if not build_linux_release():
+    if not build_linux_release(use_subprocess="--subprocess" in sys.argv[1:]):
         sys.exit(1)
     
     # Create release package
@@ -391,20 +601,20 @@ def main():
         sys.exit(1)
     
     # Create checksums
-    project_root = Path(__file__).parent.parent
-    release_dir = project_root / f"release-linux-v{version}"
+    release_dir = PROJECT_ROOT / f"release-linux-v{version}"
     create_checksums(release_dir)
     
     print("\n=== Linux Release Complete ===")
     print(f"Release package created: release-linux-v{version}/")
     print("\nContents:")
     
-    for item in release_dir.iterdir():
-        if item.is_file():
-            size = item.stat().st_size
-            print(f"  {item.name} ({size:,} bytes)")
-        elif item.is_dir():
-            print(f"  {item.name}/ (directory)")
+    with os.scandir(release_dir) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if entry.is_file():
+                size = entry.stat().st_size
+                print(f"  {entry.name} ({size:,} bytes)")
+            elif entry.is_dir():
+                print(f"  {entry.name}/ (directory)")
     
     print("\nNext steps:")
     print("1. Test the release package on target systems")
@@ -0,0 +1,6 @@
+# Cython declarations for DBCUtility.py, used only by build_exe.py --cython
+# (pure Python mode: the .py module stays the source of truth)
+import cython
+
+@cython.locals(i=Py_ssize_t, key=str, rows=set)
+cpdef _add_trigrams(dict index, str blob, object row)
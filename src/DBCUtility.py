@@ -36,9 +36,16 @@ Features:
 import sys
 import os
 import re
+import bisect
+import functools
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
-from resource_utils import get_resource_path
+from resource_utils import load_icon
+
+# Flattens line breaks and drops NUL padding from raw cantools comments in one pass
+_COMMENT_TRANSLATE = str.maketrans({"\n": " ", "\r": " ", "\0": None})
 
 def _clean_comment_text(comment_text: object) -> str:
     """
@@ -49,8 +56,12 @@ def _clean_comment_text(comment_text: object) -> str:
     """
     if not comment_text:
         return ""
+    return _clean_comment_str(str(comment_text))
 
-    cleaned = str(comment_text).strip()
+@functools.lru_cache(maxsize=4096)
+def _clean_comment_str(cleaned: str) -> str:
+    # Many signals share the same boilerplate comment, so results are cached
+    cleaned = cleaned.strip()
 
     if cleaned.startswith("None:"):
         cleaned = cleaned[5:].strip()
@@ -67,6 +78,19 @@ def _clean_comment_text(comment_text: object) -> str:
 
     return cleaned
 
+def _add_trigrams(index, blob, row):
+    """
+    Add row to index[trigram] for every trigram of blob.
+    The hottest loop of the search index; DBCUtility.pxd types it for
+    build_exe.py --cython.
+    """
+    for i in range(len(blob) - 2):
+        key = blob[i:i + 3]
+        rows = index.get(key)
+        if rows is None:
+            rows = index[key] = set()
+        rows.add(row)
+
 def show_import_error(pkg):
     try:
         from PyQt5.QtWidgets import QMessageBox, QApplication
@@ -85,15 +109,20 @@ try:
 except ImportError:
     show_import_error('PyQt5')
 
-try:
-    import cantools
-except ImportError:
+# cantools is slow to import and only needed once a DBC is loaded, so it is
+# imported lazily; find_spec still reports a missing install at startup
+import importlib.util
+if importlib.util.find_spec('cantools') is None:
     show_import_error('cantools')
 
 from search_module import UnifiedSearchWidget
 from dbc_editor_ui import DBCEditorWidget
 from home_screen import HomeScreenWidget, RecentFilesManager
 
+# Matches version = "x.y.z" in pyproject.toml (bytes, so lines need no decoding)
+_VERSION_RE = re.compile(rb'version\s*=\s*["\']([^"\']+)["\']')
+
+@functools.lru_cache(maxsize=1)
 def get_version():
     """Get version from pyproject.toml"""
     possible_paths = []
@@ -113,12 +142,12 @@ def get_version():
         
         for pyproject_path in possible_paths:
             if pyproject_path.exists():
-                with open(pyproject_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for version = "x.y.z" pattern
-                    match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                    if match:
-                        return f"v{match.group(1)}"
+                with open(pyproject_path, 'rb') as f:
+                    # Stop reading at the first version = "x.y.z" line
+                    for line in f:
+                        match = _VERSION_RE.search(line)
+                        if match:
+                            return f"v{match.group(1).decode('utf-8')}"
     except Exception as e:
         print(f"Could not read version from pyproject.toml: {e}")
     
@@ -140,23 +169,109 @@ class EmptyWidget(QtWidgets.QWidget):
         layout.addWidget(label)
         self.setLayout(layout)
 
+class _Record:
+    """Compact attribute record: one slot per field and no per-instance __dict__."""
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def items(self):
+        """Return (field, value) pairs in declaration order."""
+        return [(name, getattr(self, name)) for name in self.__slots__]
+
+    def replace(self, **changes):
+        """Return a shallow copy with the given fields replaced."""
+        return type(self)(**{name: changes.get(name, getattr(self, name)) for name in self.__slots__})
+
+class SignalRec(_Record):
+    """One signal of a loaded DBC. Underscore fields are precomputed search keys and display strings."""
+    __slots__ = (
+        "signal_name", "byte_order", "is_signed", "scale", "offset", "minimum", "maximum",
+        "start_bit_length", "unit", "initial_value",
+        "values",         # Enum/choice table {int: str} or None
+        "receivers",      # Tuple[str, ...]
+        "signal_groups",  # Tuple[str, ...] of group names this signal belongs to
+        "comments", "item_text",
+        "_name_lc", "_comments_lc", "_receivers_lc", "_min_lc", "_max_lc",
+        "_value_rows",    # Value table as sorted ((hex_value, name), ...)
+        "_receivers_str", # receivers joined with ", " for display
+    )
+
+# (field, label) pairs shown in the signal details view, in display order
+_SIG_FIELD_LABELS = tuple(
+    (name, "Start Bit|Length" if name == "start_bit_length" else name.replace('_', ' ').title())
+    for name in SignalRec.__slots__ if not name.startswith("_")
+)
+
+class MessageRec(_Record):
+    """One message of a loaded DBC. Underscore fields are precomputed search keys and display strings."""
+    __slots__ = (
+        "message_name",
+        "senders",        # Tuple[str, ...]
+        "frame_id",
+        "length",         # Message length in bytes
+        "signal_groups",  # List of (group_name, [signal_names]) tuples
+        "signals",        # List[SignalRec]
+        "_name_lc", "_frame_hex_lc", "_frame_dec_lc",
+        "_frame_hex", "_frame_type", "_length_str", "_senders_str",
+    )
+
+# Parsed databases keyed by (real path, mtime_ns, size), so reloading an
+# unchanged file skips parsing. An edited file gets a new key.
+# LRU of the last few files; loads run on QThreadPool workers, so every
+# access goes through _DBC_CACHE_LOCK (parsing itself happens outside it).
+_DBC_CACHE = OrderedDict()
+_DBC_CACHE_SIZE = 4
+_DBC_CACHE_LOCK = threading.Lock()
+
 class DBCProcessor:
     """
     Handles the logic for loading DBC files and extracting data.
     Separated from the UI for better modularity.
     """
+    @classmethod
+    def clear_cache(cls):
+        """Forget all cached parsed DBC databases."""
+        with _DBC_CACHE_LOCK:
+            _DBC_CACHE.clear()
+
     def __init__(self):
         self.db = None
-        self._extracted_data = []
+        self._extracted_data = ()
         # Metadata about the currently loaded DBC (kept separate from message list)
         self.dbc_info = None
 
-    def load_dbc_file(self, dbc_path):
-        """Loads a DBC file and populates _extracted_data."""
+    def load_dbc_file(self, dbc_path, st=None):
+        """
+        Loads a DBC file and populates _extracted_data.
+        st may be a just-taken os.stat() result for dbc_path, to save stat'ing it again.
+        The returned tuple is shared, not copied; callers must treat it as read-only.
+        """
         if not dbc_path:
             raise ValueError("No DBC file path provided.")
         try:
-            self.db = cantools.database.load_file(dbc_path)
+            if st is None:
+                st = os.stat(dbc_path)
+            real_path = os.path.realpath(dbc_path)
+            key = (real_path, st.st_mtime_ns, st.st_size)
+            with _DBC_CACHE_LOCK:
+                db = _DBC_CACHE.get(key)
+                if db is not None:
+                    _DBC_CACHE.move_to_end(key)
+            if db is None:
+                import cantools
+                db = cantools.database.load_file(dbc_path)
+                with _DBC_CACHE_LOCK:
+                    # Drop stale entries for older versions of the same file
+                    for old_key in list(_DBC_CACHE):
+                        if old_key[0] == real_path:
+                            del _DBC_CACHE[old_key]
+                    _DBC_CACHE[key] = db
+                    while len(_DBC_CACHE) > _DBC_CACHE_SIZE:
+                        _DBC_CACHE.popitem(last=False)
+            self.db = db
         except Exception as e:
             raise RuntimeError(f"Failed to load DBC file: {e}")
         self._extracted_data = []
@@ -166,7 +281,7 @@ class DBCProcessor:
             "dbc_node_count": len(self.db.nodes),
             "dbc_message_count": len(self.db.messages),
             "dbc_signal_count": sum(len(msg.signals) for msg in self.db.messages),
-            "dbc_file_size": os.path.getsize(dbc_path),
+            "dbc_file_size": st.st_size,
             "dbc_version": self.db.version,
             "dbc_buses": self.db.buses,
         }
@@ -174,76 +289,285 @@ class DBCProcessor:
         for msg in self.db.messages:
             # Signal groups come from 'SIG_GROUP_ ...;' lines in the DBC.
             # In cantools (>=40.x), they are exposed as 'Message.signal_groups'
+            # Also build a reverse index for quick membership lookups while preserving group order.
+            # signal_name -> [group_name1, group_name2, ...]
             signal_groups = []
+            signal_to_groups = {}
             for group in (getattr(msg, "signal_groups", None) or []):
                 group_name = getattr(group, "name", None)
-                group_signal_names = getattr(group, "signal_names", None) or []
-
-                if group_name and group_signal_names:
-                    signal_groups.append((group_name, list(group_signal_names)))
+                group_signal_names = list(getattr(group, "signal_names", None) or ())
 
-            # Build a reverse index for quick membership lookups while preserving group order.
-            # signal_name -> [group_name1, group_name2, ...]
-            signal_to_groups = {}
-            for group_name, group_signals in signal_groups:
-                for sig_name in group_signals:
+                if not (group_name and group_signal_names):
+                    continue
+                signal_groups.append((group_name, group_signal_names))
+                for sig_name in group_signal_names:
                     signal_to_groups.setdefault(sig_name, []).append(group_name)
             
-            message_info = {
-                "message_name": msg.name,
-                "senders": [str(s) for s in msg.senders],
-                "frame_id": msg.frame_id,
-                "length": msg.length,  # Message length in bytes
-                "signal_groups": signal_groups,  # List of (group_name, [signal_names]) tuples
-                "signals": []
-            }
+            signals = []
             for sig in msg.signals:
-                raw_comments = str(sig.comments).strip('\0').replace('\n', ' ') if sig.comments else ""
+                # Attributes are read directly: cantools (>=40) always defines them
+                sig_name = sig.name
+                comments = sig.comments
+                raw_comments = str(comments).translate(_COMMENT_TRANSLATE).strip() if comments else ""
                 cleaned_comments = _clean_comment_text(raw_comments)
                 # Extract value table/enum if available
-                values_dict = {}
-                if hasattr(sig, 'choices') and sig.choices:
-                    values_dict = {int(k): str(v) for k, v in sig.choices.items()}
+                choices = sig.choices
+                values_dict = {int(k): str(v) for k, v in choices.items()} if choices else None
+                receivers = tuple([str(r) for r in sig.receivers])
+                minimum = sig.minimum
+                maximum = sig.maximum
                 
-                # Find which signal groups this signal belongs to (if any)
-                signal_groups_membership = signal_to_groups.get(sig.name, [])
-                
-                signal_info = {
-                    "signal_name": sig.name,
-                    "byte_order": getattr(sig, 'byte_order', 'little_endian'),
-                    "is_signed": sig.is_signed,
-                    "scale": getattr(sig, 'scale', 1.0),
-                    "offset": getattr(sig, 'offset', 0.0),
-                    "minimum": sig.minimum,
-                    "maximum": sig.maximum,
-                    "start bit|length": f"{sig.start}|{sig.length}",
-                    "unit": getattr(sig, 'unit', '') or '',
-                    "initial_value": getattr(sig, 'initial', None),
-                    "values": values_dict if values_dict else None,  # Enum/choice table
-                    "receivers": [str(r) for r in sig.receivers],
-                    "signal_groups": signal_groups_membership,  # List[str] of group names this signal belongs to
-                    "comments": cleaned_comments,
-                    "item_text": f"{msg.name}.{sig.name}"
-                }
-                message_info["signals"].append(signal_info)
-            self._extracted_data.append(message_info)
-        return list(self._extracted_data)
+                signals.append(SignalRec(
+                    signal_name=sig_name,
+                    byte_order=sig.byte_order,
+                    is_signed=sig.is_signed,
+                    scale=sig.scale,
+                    offset=sig.offset,
+                    minimum=minimum,
+                    maximum=maximum,
+                    start_bit_length=f"{sig.start}|{sig.length}",
+                    unit=sig.unit or '',
+                    # Not present on every cantools release, so keep the fallback here
+                    initial_value=getattr(sig, 'initial', None),
+                    values=values_dict,
+                    receivers=receivers,
+                    # Find which signal groups this signal belongs to (if any)
+                    signal_groups=tuple(signal_to_groups.get(sig_name, ())),
+                    comments=cleaned_comments,
+                    item_text=f"{msg.name}.{sig_name}",
+                    _name_lc=sig_name.lower(),
+                    _comments_lc=cleaned_comments.lower(),
+                    _receivers_lc=",".join(receivers).lower(),
+                    _min_lc=str(minimum).lower(),
+                    _max_lc=str(maximum).lower(),
+                    _value_rows=tuple((hex(k), v) for k, v in sorted(values_dict.items())) if values_dict else (),
+                    _receivers_str=", ".join(receivers),
+                ))
+            
+            frame_hex = hex(msg.frame_id)  # hex() is already lowercase
+            senders = tuple([str(s) for s in msg.senders])
+            self._extracted_data.append(MessageRec(
+                message_name=msg.name,
+                senders=senders,
+                frame_id=msg.frame_id,
+                length=msg.length,
+                signal_groups=signal_groups,
+                signals=signals,
+                # Lowercased search keys, precomputed for ConverterWindow's filter
+                _name_lc=msg.name.lower(),
+                _frame_hex_lc=frame_hex,
+                _frame_dec_lc=str(msg.frame_id),
+                # Display strings for the viewer tree
+                _frame_hex=frame_hex,
+                _frame_type="Extended" if msg.frame_id > 0x7FF else "Standard",
+                _length_str=f"{msg.length} bytes",
+                _senders_str=", ".join(senders) if senders else "None",
+            ))
+        self._extracted_data = tuple(self._extracted_data)
+        return self._extracted_data
 
     def get_extracted_data(self):
-        return list(self._extracted_data)
+        """Return the (read-only, shared) extracted message data."""
+        return self._extracted_data
 
 
 
+class _DbcLoadSignals(QtCore.QObject):
+    """
+    Signals for DbcLoadRunnable. The object lives in the GUI thread, so the
+    connected slots run there even though the runnable emits from a pool thread.
+    """
+    finished = QtCore.pyqtSignal(int, object, object)  # generation, DBCProcessor, extracted data
+    failed = QtCore.pyqtSignal(int, str)                # generation, error message
+
+class DbcLoadRunnable(QtCore.QRunnable):
+    """Parses a DBC file on a QThreadPool thread, using its own DBCProcessor."""
+
+    def __init__(self, signals, generation, dbc_path, st=None):
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._dbc_path = dbc_path
+        self._st = st
+
+    def run(self):
+        processor = DBCProcessor()
+        try:
+            data = processor.load_dbc_file(self._dbc_path, self._st)
+        except Exception as e:
+            self._signals.failed.emit(self._generation, str(e))
+            return
+        self._signals.finished.emit(self._generation, processor, data)
+
+class _TreeNode:
+    """
+    One row of the viewer tree.
+    If a builder is given, children are created by calling builder(node) the
+    first time they are needed (usually when the row is first expanded).
+    """
+    __slots__ = ("parent", "row", "texts", "data", "_children", "_builder")
+
+    def __init__(self, parent, key, value="", type_name="", data=None, builder=None):
+        self.parent = parent
+        self.texts = (key, value, type_name)
+        self.data = data
+        self._builder = builder
+        self._children = None if builder else []
+        if parent is None:
+            self.row = 0
+        else:
+            siblings = parent._children
+            self.row = len(siblings)
+            siblings.append(self)
+
+    @property
+    def children(self):
+        if self._children is None:
+            self._children = []
+            builder, self._builder = self._builder, None
+            builder(self)
+        return self._children
+
+    def has_children(self):
+        return self._builder is not None or bool(self._children)
+
+class DbcTreeModel(QtCore.QAbstractItemModel):
+    """
+    Item model behind the viewer's QTreeView.
+    Rows are plain _TreeNode objects; the view only asks for the rows it
+    shows, so subtrees of collapsed rows are never built.
+    """
+    HEADERS = ("Key", "Value", "Type")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = _TreeNode(None, "")
+        self._summary_brush = QtGui.QBrush(QtGui.QColor("#2980B9"))
+
+    def set_root(self, root):
+        """Replace the whole tree; root's children become the top-level rows."""
+        self.beginResetModel()
+        self._root = root
+        self.endResetModel()
+
+    def clear(self):
+        self.set_root(_TreeNode(None, ""))
+
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index_of(self, node):
+        return self.createIndex(node.row, 0, node)
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, self.node(parent).children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QtCore.QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        # Answered without running the builder, so collapsed rows stay unbuilt
+        if parent.column() > 0:
+            return False
+        return self.node(parent).has_children()
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == QtCore.Qt.DisplayRole:
+            return node.texts[index.column()]
+        if role == QtCore.Qt.UserRole:
+            return node.data
+        if role == QtCore.Qt.ForegroundRole and index.column() == 0 and node.texts[2] == "Summary":
+            return self._summary_brush
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+# Details panel markup; only the {placeholders} vary between items
+_PANEL_OPEN = "<div style='background-color:#f7fafc; border-radius:8px; padding:18px 18px 10px 18px; margin-bottom:10px; border:1px solid #e0e0e0;'>"
+_MSG_HEADER_TMPL = (
+    _PANEL_OPEN
+    + "<div style='margin-bottom:8px;'><b>Frame ID:</b> <span style='color:#E67E22;'>{frame_id}</span></div>"
+    "<div style='margin-bottom:8px;'><b>Senders:</b> <span style='color:#2980B9;'>{senders}</span></div>"
+    "</div>"
+)
+_SIGNALS_HEADING = "<div style='margin-top:18px;'><span style='font-size:14pt; color:#2C3E50; font-weight:bold;'>Signals</span></div>"
+_NO_SIGNALS_HTML = "<div style='font-style:italic; color:#7F8C8D; margin-top:10px;'>No signals for this message.</div>"
+_SIG_CARD_TMPL = (
+    "<div style='background-color:#f0f4f8; border-radius:6px; padding:10px 12px; margin:10px 0 10px 0; border-left: 4px solid #3498DB;'>"
+    "<div style='font-size:12pt; color:#16A085; font-weight:bold;'>{name}</div>"
+    "{comments}"
+    "<div><b>Receivers:</b> {receivers}</div>"
+    "<div><b>Is Signed:</b> {is_signed}</div>"
+    "<div><b>Minimum:</b> {minimum}</div>"
+    "<div><b>Maximum:</b> {maximum}</div>"
+    "<div><b>Start Bit|Length:</b> {start_bit_length}</div>"
+    "</div>"
+)
+_SIG_COMMENTS_TMPL = "<div style='margin-bottom:4px; color:#888;'><b>Comments:</b> {comments}</div>"
+_FIELD_TMPL = "<div style='margin-bottom:8px;'><b>{label}:</b> {value}</div>"
+_VALUE_TABLE_TMPL = (
+    "<div style='margin-bottom:12px;'><b>{label}:</b></div>"
+    "<div style='background-color:#f0f4f8; border-radius:6px; padding:10px; margin-left:10px;'>{rows}</div>"
+)
+_ENUM_ROW_TMPL = "<div style='margin-bottom:6px; padding:4px 8px; background-color:#ffffff; border-radius:4px; border-left:3px solid #3498DB;'><span style='color:#E67E22; font-weight:bold;'>{hex_val}</span> → <span style='color:#2C3E50;'>{name}</span></div>"
+_SENDERS_TMPL = "<div style='background-color:#f7fafc; border-radius:8px; padding:18px; border:1px solid #e0e0e0;'><div><b>Senders:</b> {senders}</div></div>"
+_NO_SELECTION_HTML = "<div style='text-align:center; color:#7F8C8D;'><i>Select an item from the tree to view its details.</i></div>"
+
 class ConverterWindow(QtWidgets.QWidget):
     """
     Main DBC viewer interface with error handling and improved readability.
     """
     dbcFileLoaded = QtCore.pyqtSignal(str)
+    # Bound on cached details-panel renders; oldest entries are evicted first
+    DETAIL_CACHE_SIZE = 512
+    # Above this many messages only the top level of the tree is expanded
+    LARGE_TREE_MESSAGES = 200
+    # Pause in keyboard navigation before the details panel is rendered
+    NAV_RENDER_DELAY_MS = 30
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.dbc_processor = DBCProcessor()
+        # DBC files are parsed off the GUI thread; only the result of the
+        # latest load (matching _load_generation) is shown
+        self._load_generation = 0
+        self._load_signals = _DbcLoadSignals(self)
+        self._load_signals.finished.connect(self._on_dbc_loaded)
+        self._load_signals.failed.connect(self._on_dbc_load_failed)
         self._full_data = []
+        self._signal_index = []
+        self._trigram_index = {}
+        self._row_offsets = []
+        self._signal_haystack = ""
+        # Rendered (title, html) of the details panel, keyed by record object
+        self._detail_html_cache = OrderedDict()
+        # Details panel renderer per row data type
+        self._detail_renderers = {
+            MessageRec: self._render_message_details,
+            SignalRec: self._render_signal_details,
+            dict: self._render_row_dict_details,
+        }
         self._setup_ui()
 
     def _setup_ui(self):
@@ -307,13 +631,23 @@ class ConverterWindow(QtWidgets.QWidget):
         left_v_layout.addSpacing(10)
         self.search_widget = UnifiedSearchWidget(self, mode="view")
         self.search_widget.search_edit.setPlaceholderText("Search messages, signals, or frame IDs...")
-        self.search_widget.searchChanged.connect(self._apply_filter_to_tree)
+        # Coalesce keystrokes: only the query typed last is applied, 150 ms after it
+        self._pending_query, self._pending_type = "", "all"
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(
+            lambda: self._apply_filter_to_tree(self._pending_query, self._pending_type))
+        self.search_widget.searchChanged.connect(self._schedule_filter)
         left_v_layout.addWidget(self.search_widget)
-        self.tree_widget = QtWidgets.QTreeWidget()
-        self.tree_widget.setHeaderLabels(["Key", "Value", "Type"])
-        self.tree_widget.header().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
-        self.tree_widget.setAlternatingRowColors(True)
-        left_v_layout.addWidget(self.tree_widget)
+        self.tree_model = DbcTreeModel(self)
+        self.tree_view = QtWidgets.QTreeView()
+        self.tree_view.setModel(self.tree_model)
+        self.tree_view.header().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        self.tree_view.setAlternatingRowColors(True)
+        # Every row is one line of plain text, so Qt can skip per-item height queries
+        self.tree_view.setUniformRowHeights(True)
+        left_v_layout.addWidget(self.tree_view)
         main_h_layout.addLayout(left_v_layout, 2)
         right_v_layout = QtWidgets.QVBoxLayout()
         self.refresh_btn = QtWidgets.QPushButton("Refresh")
@@ -344,6 +678,13 @@ class ConverterWindow(QtWidgets.QWidget):
         self.details_text_edit.setReadOnly(True)
         self.details_text_edit.setFont(QtGui.QFont("Monospace", 10))
         self.details_widget_layout.addWidget(self.details_text_edit)
+        # Coalesce rapid selection changes (e.g. arrow-key navigation): only
+        # the row selected last is rendered, NAV_RENDER_DELAY_MS after it
+        self._details_pending = False
+        self._pending_item_data = None
+        self._render_timer = QtCore.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self._flush_pending_render)
         right_v_layout.addWidget(self.details_widget)
         main_h_layout.addLayout(right_v_layout, 1)
         self.setLayout(main_h_layout)
@@ -351,14 +692,17 @@ class ConverterWindow(QtWidgets.QWidget):
         self.load_signals_btn.clicked.connect(self.load_and_display_signals)
         self.refresh_btn.clicked.connect(self.load_and_display_signals)
         self.exitBtn.clicked.connect(self.parent().close)
-        self.tree_widget.itemClicked.connect(self.display_item_details)
+        # A click is a deliberate pick: render on the next event-loop turn.
+        # Current-row changes (keyboard) wait for navigation to pause.
+        self.tree_view.clicked.connect(lambda index: self.display_item_details(index, 0))
+        self.tree_view.selectionModel().currentChanged.connect(
+            lambda current, previous: self.display_item_details(current))
 
     def _set_button_icon(self, button, icon_path):
         """Set icon for a button if the icon file exists."""
         try:
-            full_icon_path = get_resource_path(icon_path)
-            if os.path.exists(full_icon_path):
-                icon = QtGui.QIcon(full_icon_path)
+            icon = load_icon(icon_path)
+            if icon is not None:
                 button.setIcon(icon)
                 # Set icon size
                 button.setIconSize(QtCore.QSize(16, 16))
@@ -384,15 +728,19 @@ class ConverterWindow(QtWidgets.QWidget):
             if not file_path:
                 self._show_error("No DBC file path provided.")
                 return False
-            if not os.path.exists(file_path):
+            path = Path(file_path)
+            try:
+                st = path.stat()
+            except FileNotFoundError:
                 self._show_error(f"DBC file not found:\n{file_path}")
                 return False
-            if not file_path.lower().endswith(".dbc"):
+            if path.suffix.lower() != ".dbc":
                 self._show_error("Selected file must have .dbc extension.")
                 return False
 
             self._prepare_new_dbc(file_path)
-            self.load_and_display_signals()
+            # Hand the stat result on so the file is not stat'ed a second time
+            self._load_and_display(st)
             return True
         except Exception as e:
             self._show_error(f"Error loading DBC file: {e}")
@@ -405,12 +753,23 @@ class ConverterWindow(QtWidgets.QWidget):
         self.dbc_file_name_label.setText(file_name)
         self.dbc_file_name_label.setToolTip(file_path or "")
         self.message_label.setText("DBC file selected.")
-        self.tree_widget.clear()
+        self.tree_model.clear()
+        self._render_timer.stop()
+        self._details_pending = False
+        self._pending_item_data = None
         self.details_text_edit.clear()
         self.details_title_label.setText("Item Details")
         self.search_widget.clear_search()
-        self.dbc_processor._extracted_data = []
+        # Drop the result of any load still running for the previous file
+        self._load_generation += 1
+        self._set_loading(False)
+        self.dbc_processor._extracted_data = ()
         self._full_data = []
+        self._signal_index = []
+        self._trigram_index = {}
+        self._row_offsets = []
+        self._signal_haystack = ""
+        self._detail_html_cache.clear()
         # Clear file info panel
         self.info_node_count.setText("Nodes: —")
         self.info_message_count.setText("Messages: —")
@@ -420,12 +779,42 @@ class ConverterWindow(QtWidgets.QWidget):
         self.info_buses.setText("Buses: —")
 
     def load_and_display_signals(self):
+        self._load_and_display()
+
+    def _load_and_display(self, st=None):
+        """Load self.dbc_path and show it; st is an optional fresh os.stat() of it."""
         if not hasattr(self, 'dbc_path') or not self.dbc_path:
             self._show_error("Please select a DBC file first.")
             return
+        self._load_generation += 1
+        self.message_label.setText("Loading DBC file and extracting data...")
+        self._set_loading(True)
+        QtCore.QThreadPool.globalInstance().start(
+            DbcLoadRunnable(self._load_signals, self._load_generation, self.dbc_path, st))
+
+    def _set_loading(self, loading):
+        """Show a busy state while a DBC file is parsed in the background."""
+        self.load_signals_btn.setEnabled(not loading)
+        self.refresh_btn.setEnabled(not loading)
+        if loading:
+            self.setCursor(QtCore.Qt.BusyCursor)
+        else:
+            self.unsetCursor()
+
+    def _on_dbc_load_failed(self, generation, message):
+        if generation != self._load_generation:
+            return  # superseded by a newer load
+        self._set_loading(False)
+        self._show_error(f"Error loading DBC file: {message}")
+
+    def _on_dbc_loaded(self, generation, processor, data):
+        if generation != self._load_generation:
+            return  # superseded by a newer load
+        self._set_loading(False)
         try:
-            self.message_label.setText("Loading DBC file and extracting data...")
-            self._full_data = self.dbc_processor.load_dbc_file(self.dbc_path)
+            self.dbc_processor = processor
+            self._full_data = data
+            self._build_search_index()
             self._apply_filter_to_tree()
             self._update_file_info()
             self.message_label.setText("DBC file loaded successfully")
@@ -463,107 +852,159 @@ class ConverterWindow(QtWidgets.QWidget):
         else:
             self.info_buses.setText("Buses: —")
 
+    def _schedule_filter(self, search_query, filter_type):
+        """Stash the latest search and (re)start the debounce timer."""
+        self._pending_query, self._pending_type = search_query, filter_type
+        self._filter_timer.start()
+
+    def _build_search_index(self):
+        """
+        Index the loaded signals for filtering.
+        Each row is (msg_idx, sig_idx, blob), where blob joins the signal's
+        lowercased search fields with NUL so a match cannot span two fields.
+        Queries of 3+ characters only check rows sharing all of their trigrams;
+        shorter ones are searched in all blobs joined into one haystack string.
+        """
+        self._signal_index = []
+        self._trigram_index = {}
+        self._row_offsets = []
+        for msg_idx, msg_data in enumerate(self._full_data):
+            for sig_idx, sig_data in enumerate(msg_data.signals):
+                blob = "\0".join((sig_data._name_lc, sig_data._comments_lc,
+                                   sig_data._receivers_lc, sig_data._min_lc,
+                                   sig_data._max_lc))
+                _add_trigrams(self._trigram_index, blob, len(self._signal_index))
+                self._signal_index.append((msg_idx, sig_idx, blob))
+        # Rows are separated by \x01, which a typed query cannot contain
+        offset = 0
+        for _, _, blob in self._signal_index:
+            self._row_offsets.append(offset)
+            offset += len(blob) + 1
+        self._signal_haystack = "\x01".join(blob for _, _, blob in self._signal_index)
+
+    def _match_signals(self, query):
+        """Return {msg_idx: [sig_idx, ...]} for signals whose search fields contain query."""
+        if len(query) >= 3:
+            candidates = None
+            for i in range(len(query) - 2):
+                rows = self._trigram_index.get(query[i:i + 3])
+                if not rows:
+                    return {}
+                candidates = set(rows) if candidates is None else candidates & rows
+                if not candidates:
+                    return {}
+            # With many candidates (common trigrams), one C-level scan of the
+            # whole haystack beats confirming each candidate in Python
+            if len(candidates) * 4 <= len(self._signal_index):
+                hits = {}
+                for row in sorted(candidates):
+                    msg_idx, sig_idx, blob = self._signal_index[row]
+                    if query in blob:
+                        hits.setdefault(msg_idx, []).append(sig_idx)
+                return hits
+
+        # Short or unselective query: let str.find scan every blob at C speed,
+        # so the Python loop only runs once per matching row
+        hits = {}
+        haystack, offsets = self._signal_haystack, self._row_offsets
+        if not offsets:
+            return hits
+        pos = haystack.find(query)
+        while pos != -1:
+            row = bisect.bisect_right(offsets, pos) - 1
+            msg_idx, sig_idx, _ = self._signal_index[row]
+            hits.setdefault(msg_idx, []).append(sig_idx)
+            if row + 1 >= len(offsets):
+                break
+            pos = haystack.find(query, offsets[row + 1])
+        return hits
+
     def _apply_filter_to_tree(self, search_query="", filter_type="all"):
         try:
             if not self._full_data:
-                self._populate_tree_widget([])
+                self._populate_tree([])
                 return
             search_query_lower = search_query.lower().strip()
             filtered_results = []
             if not search_query_lower and filter_type == "all":
-                filtered_results = list(self._full_data)
+                filtered_results = self._full_data
             else:
-                for msg_data in self._full_data:
-                    message_matches = False
-                    signals_matching = []
-                    if filter_type == "all" or filter_type == "message":
-                        if search_query_lower in msg_data["message_name"].lower():
-                            message_matches = True
-                    if filter_type == "all" or filter_type == "frame_id":
-                        if search_query_lower in str(hex(msg_data["frame_id"])).lower() or \
-                           search_query_lower in str(msg_data["frame_id"]).lower():
-                            message_matches = True
-                    for sig_data in msg_data["signals"]:
-                        signal_level_match = False
-                        if filter_type == "all" or filter_type == "signal":
-                            if (search_query_lower in sig_data["signal_name"].lower() or
-                                search_query_lower in sig_data["comments"].lower() or
-                                search_query_lower in ",".join(sig_data["receivers"]).lower() or
-                                search_query_lower in str(sig_data.get("minimum", "")).lower() or
-                                search_query_lower in str(sig_data.get("maximum", "")).lower()):
-                                signal_level_match = True
-                        if filter_type == "frame_id" and (search_query_lower in str(hex(msg_data["frame_id"])).lower() or \
-                                                          search_query_lower in str(msg_data["frame_id"]).lower()):
-                            if not search_query_lower or signal_level_match:
-                                signals_matching.append(sig_data)
-                        elif signal_level_match:
-                            signals_matching.append(sig_data)
-                    if message_matches:
+                # Resolve the filter mode once instead of per message
+                check_name = filter_type in ("all", "message")
+                check_frame = filter_type in ("all", "frame_id")
+                check_signals = filter_type in ("all", "signal")
+                message_matches = [
+                    (check_name and search_query_lower in msg_data._name_lc) or
+                    (check_frame and (search_query_lower in msg_data._frame_hex_lc or
+                                      search_query_lower in msg_data._frame_dec_lc))
+                    for msg_data in self._full_data
+                ]
+                # A matching message is shown whole, so signals only need
+                # searching when some message did not match by itself
+                if check_signals and not all(message_matches):
+                    signal_hits = self._match_signals(search_query_lower)
+                else:
+                    signal_hits = {}
+                for msg_idx, msg_data in enumerate(self._full_data):
+                    if message_matches[msg_idx]:
                         filtered_results.append(msg_data)
-                    elif signals_matching:
-                        temp_msg_data = msg_data.copy()
-                        temp_msg_data["signals"] = signals_matching
-                        filtered_results.append(temp_msg_data)
-            self._populate_tree_widget(filtered_results)
+                        continue
+                    if msg_idx in signal_hits:
+                        filtered_results.append(msg_data.replace(
+                            signals=[msg_data.signals[sig_idx] for sig_idx in signal_hits[msg_idx]]))
+            self._populate_tree(filtered_results)
         except Exception as e:
             self._show_error(f"Error filtering data: {e}")
 
     @staticmethod
-    def _tree_add_group(parent, title: str, type_name: str = "Group") -> QtWidgets.QTreeWidgetItem:
-        item = QtWidgets.QTreeWidgetItem(parent)
-        item.setText(0, title)
-        item.setText(2, type_name)
-        return item
+    def _tree_add_group(parent, title: str, type_name: str = "Group") -> _TreeNode:
+        return _TreeNode(parent, title, "", type_name)
 
     @staticmethod
-    def _tree_add_row(parent, key: str, value, type_name: str) -> QtWidgets.QTreeWidgetItem:
-        item = QtWidgets.QTreeWidgetItem(parent)
-        item.setText(0, key)
-        item.setText(1, str(value))
-        item.setText(2, type_name)
-        return item
-
-    def _add_signal_to_tree(self, parent_item, sig_data):
+    def _tree_add_row(parent, key: str, value, type_name: str) -> _TreeNode:
+        return _TreeNode(parent, key, str(value), type_name)
+
+    def _add_signals_to_tree(self, parent_item, signals):
         """
-        Helper method to add a signal item with all its properties to the tree.
-        
+        Helper method to add signal rows to the tree in one batch.
+        Their property rows are added lazily when a row is first expanded.
+
         Args:
-            parent_item: QTreeWidgetItem to add the signal under
-            sig_data: Dictionary containing signal information
+            parent_item: _TreeNode to add the signals under
+            signals: iterable of SignalRec
         """
-        sig_item = QtWidgets.QTreeWidgetItem(parent_item)
-        sig_item.setText(0, sig_data["signal_name"])
-        sig_item.setText(2, "Signal")
-        sig_item.setData(0, QtCore.Qt.UserRole, sig_data)
+        builder = self._add_signal_properties
+        for sig_data in signals:
+            _TreeNode(parent_item, sig_data.signal_name, "", "Signal", sig_data, builder=builder)
 
+    def _add_signal_properties(self, sig_item):
+        """Add the summary and property rows under a signal row (builder for signal nodes)."""
+        sig_data = sig_item.data
         # Summary line (quick glance)
         summary_parts = []
-        scale = sig_data.get("scale", 1.0)
-        offset = sig_data.get("offset", 0.0)
+        scale = sig_data.scale
+        offset = sig_data.offset
         if scale != 1.0 or offset != 0.0:
             summary_parts.append(f"Scale: {scale}, Offset: {offset}")
 
-        unit = sig_data.get("unit") or ""
+        unit = sig_data.unit
         if unit:
             summary_parts.append(f"Unit: {unit}")
 
-        summary_parts.append("Signed" if sig_data.get("is_signed") else "Unsigned")
+        summary_parts.append("Signed" if sig_data.is_signed else "Unsigned")
 
-        summary_item = QtWidgets.QTreeWidgetItem(sig_item)
-        summary_item.setText(0, "Summary")
-        summary_item.setText(1, " | ".join(summary_parts))
-        summary_item.setText(2, "Summary")
-        summary_item.setForeground(0, QtGui.QBrush(QtGui.QColor("#2980B9")))
+        # Highlighted by DbcTreeModel (type "Summary")
+        _TreeNode(sig_item, "Summary", " | ".join(summary_parts), "Summary")
 
         # Basic Properties
         basic_group = self._tree_add_group(sig_item, "Basic Properties")
-        start_bit_length = sig_data.get("start bit|length")
+        start_bit_length = sig_data.start_bit_length
         if start_bit_length:
             self._tree_add_row(basic_group, "Start Bit|Length", start_bit_length, "str")
-        byte_order = sig_data.get("byte_order", "little_endian")
+        byte_order = sig_data.byte_order
         byte_order_display = f"{byte_order} (Intel)" if byte_order == "little_endian" else f"{byte_order} (Motorola)"
         self._tree_add_row(basic_group, "Byte Order", byte_order_display, "str")
-        self._tree_add_row(basic_group, "Signed", "Yes" if sig_data.get("is_signed") else "No", "bool")
+        self._tree_add_row(basic_group, "Signed", "Yes" if sig_data.is_signed else "No", "bool")
 
         # Scaling Properties
         scaling_group = self._tree_add_group(sig_item, "Scaling Properties")
@@ -573,8 +1014,8 @@ class ConverterWindow(QtWidgets.QWidget):
             self._tree_add_row(scaling_group, "Unit", unit, "str")
 
         # Range Properties (only if present)
-        minimum = sig_data.get("minimum")
-        maximum = sig_data.get("maximum")
+        minimum = sig_data.minimum
+        maximum = sig_data.maximum
         if minimum is not None or maximum is not None:
             range_group = self._tree_add_group(sig_item, "Range Properties")
             if minimum is not None:
@@ -583,167 +1024,237 @@ class ConverterWindow(QtWidgets.QWidget):
                 self._tree_add_row(range_group, "Maximum", maximum, "float")
 
         # Initial Value
-        initial_value = sig_data.get("initial_value")
+        initial_value = sig_data.initial_value
         if initial_value is not None:
             self._tree_add_row(sig_item, "Initial Value", initial_value, type(initial_value).__name__)
 
         # Value Table (Enums)
-        values = sig_data.get("values")
-        if values:
+        if sig_data._value_rows:
             values_group = self._tree_add_group(sig_item, "Value Table (Enums)")
-            for enum_val, enum_name in sorted(values.items()):
-                hex_val = hex(enum_val)
+            for hex_val, enum_name in sig_data._value_rows:
                 self._tree_add_row(values_group, hex_val, enum_name, "Enum")
 
         # Receivers
-        receivers = sig_data.get("receivers") or []
-        if receivers:
-            self._tree_add_row(sig_item, "Receivers", ", ".join(receivers), "List")
+        if sig_data.receivers:
+            self._tree_add_row(sig_item, "Receivers", sig_data._receivers_str, "List")
 
         # Signal Groups
-        memberships = sig_data.get("signal_groups") or []
+        memberships = sig_data.signal_groups
         if memberships:
             self._tree_add_row(sig_item, "Signal Groups", ", ".join(memberships), "List")
 
-        # Comments
-        comments = sig_data.get("comments") or ""
-        if comments:
-            displayed_comment = _clean_comment_text(comments)
+        # Comments (already cleaned by DBCProcessor.load_dbc_file)
+        displayed_comment = sig_data.comments
+        if displayed_comment:
             if len(displayed_comment) > 50:
                 displayed_comment = displayed_comment[:50] + "..."
-            if displayed_comment:  # Only show if there's content after cleaning
-                self._tree_add_row(sig_item, "Comments", displayed_comment, "str")
+            self._tree_add_row(sig_item, "Comments", displayed_comment, "str")
 
-    def _populate_tree_widget(self, data):
+    def _populate_tree(self, data):
         """
-        Populate the tree widget with message and signal data.
+        Populate the tree view with message and signal data.
         If signal groups exist, signals are organized under their respective groups.
         Ungrouped signals are displayed separately.
         """
-        self.tree_widget.clear()
-        if not data:
-            QtWidgets.QTreeWidgetItem(self.tree_widget).setText(0, "No matching data found.")
-            return
+        # Repaint once at the end instead of after every expansion
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            self._build_tree_items(data)
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
 
+    def _build_tree_items(self, data):
+        self._detail_html_cache.clear()
+        root = _TreeNode(None, "")
+        if not data:
+            _TreeNode(root, "No matching data found.")
+        # Only the message rows are created here; each message's subtree is
+        # built by _add_message_rows when the view first needs it
         for msg_data in data:
-            msg_item = QtWidgets.QTreeWidgetItem(self.tree_widget)
-            msg_item.setText(0, msg_data["message_name"])
-
-            frame_id = msg_data["frame_id"]
-            frame_type = "Extended" if frame_id > 0x7FF else "Standard"
-            msg_item.setText(1, f"Frame ID: {hex(frame_id)} ({frame_type})")
-            msg_item.setText(2, "Message")
-            msg_item.setData(0, QtCore.Qt.UserRole, msg_data)
-
-            # Message properties
-            msg_props_item = self._tree_add_group(msg_item, "Message Properties", "Group")
-            self._tree_add_row(msg_props_item, "Length", f"{msg_data.get('length', 'N/A')} bytes", "int")
-            self._tree_add_row(msg_props_item, "Frame ID", f"{hex(frame_id)} (decimal: {frame_id})", "int")
-            self._tree_add_row(msg_props_item, "Frame Type", frame_type, "str")
-
-            # Senders
-            senders = msg_data.get("senders") or []
-            senders_item = self._tree_add_row(msg_item, "Senders", ", ".join(senders) if senders else "None", "List")
-            senders_item.setData(0, QtCore.Qt.UserRole, {"Type": "Senders List", "Senders": senders})
-
-            # Signals grouped by name for fast lookup
-            signals = msg_data.get("signals") or []
-            signals_by_name = {sig["signal_name"]: sig for sig in signals}
-            signals_added_to_groups = set()
-
-            # Signal Groups -> Signals
-            signal_groups = msg_data.get("signal_groups") or []
-            if signal_groups:
-                signal_groups_item = self._tree_add_group(msg_item, "Signal Groups", "Collection")
-                for group_name, group_signal_names in signal_groups:
-                    group_item = self._tree_add_group(signal_groups_item, group_name, "Group")
-                    group_item.setData(
-                        0,
-                        QtCore.Qt.UserRole,
-                        {"Type": "Signal Group", "Name": group_name, "Signals": group_signal_names},
-                    )
-
-                    for sig_name in group_signal_names:
-                        sig_data = signals_by_name.get(sig_name)
-                        if sig_data:
-                            signals_added_to_groups.add(sig_name)
-                            self._add_signal_to_tree(group_item, sig_data)
-
-            # Ungrouped signals (or all signals if no groups)
-            ungrouped = [sig for sig in signals if sig["signal_name"] not in signals_added_to_groups]
-            if ungrouped:
-                title = "Ungrouped Signals" if signal_groups else "Signals"
-                root = self._tree_add_group(msg_item, title, "Collection")
-                for sig_data in ungrouped:
-                    self._add_signal_to_tree(root, sig_data)
-
-        self.tree_widget.expandAll()
-
-    def display_item_details(self, item, column):
-        try:
-            item_data = item.data(0, QtCore.Qt.UserRole)
-            details_html = []
-            # Set the title label appropriately
-            if item_data:
-                if "message_name" in item_data:
-                    self.details_title_label.setText(f"Message: {item_data['message_name']}")
-                    details_html.append("<div style='background-color:#f7fafc; border-radius:8px; padding:18px 18px 10px 18px; margin-bottom:10px; border:1px solid #e0e0e0;'>")
-                    details_html.append(f"<div style='margin-bottom:8px;'><b>Frame ID:</b> <span style='color:#E67E22;'>{hex(item_data['frame_id'])}</span></div>")
-                    details_html.append(f"<div style='margin-bottom:8px;'><b>Senders:</b> <span style='color:#2980B9;'>{', '.join(item_data['senders'])}</span></div>")
-                    if item_data.get('comments'):
-                        details_html.append(f"<div style='margin-bottom:8px;'><b>Comments:</b> <span style='color:#888;'>{item_data['comments']}</span></div>")
-                    details_html.append("</div>")
-                    if item_data["signals"]:
-                        details_html.append("<div style='margin-top:18px;'><span style='font-size:14pt; color:#2C3E50; font-weight:bold;'>Signals</span></div>")
-                        for sig in item_data["signals"]:
-                            details_html.append("<div style='background-color:#f0f4f8; border-radius:6px; padding:10px 12px; margin:10px 0 10px 0; border-left: 4px solid #3498DB;'>")
-                            details_html.append(f"<div style='font-size:12pt; color:#16A085; font-weight:bold;'>{sig['signal_name']}</div>")
-                            if sig.get('comments'):
-                                details_html.append(f"<div style='margin-bottom:4px; color:#888;'><b>Comments:</b> {sig['comments']}</div>")
-                            details_html.append(f"<div><b>Receivers:</b> {', '.join(sig['receivers'])}</div>")
-                            details_html.append(f"<div><b>Is Signed:</b> {sig['is_signed']}</div>")
-                            details_html.append(f"<div><b>Minimum:</b> {sig['minimum']}</div>")
-                            details_html.append(f"<div><b>Maximum:</b> {sig['maximum']}</div>")
-                            details_html.append(f"<div><b>Maximum:</b> {sig['maximum']}</div>")
-                            details_html.append(f"<div><b>Start Bit|Length:</b> {sig['start bit|length']}</div>")
-                            details_html.append("</div>")
-                    else:
-                        details_html.append("<div style='font-style:italic; color:#7F8C8D; margin-top:10px;'>No signals for this message.</div>")
-                elif "signal_name" in item_data:
-                    self.details_title_label.setText(f"Signal: {item_data['signal_name']}")
-                    details_html.append("<div style='background-color:#f7fafc; border-radius:8px; padding:18px 18px 10px 18px; margin-bottom:10px; border:1px solid #e0e0e0;'>")
-                    for key, value in item_data.items():
-                        # Format byte_order with Intel/Motorola labels
-                        if key == "byte_order":
-                            byte_order_display = f"{value} (Intel)" if value == "little_endian" else f"{value} (Motorola)"
-                            details_html.append(f"<div style='margin-bottom:8px;'><b>{key.replace('_', ' ').title()}:</b> {byte_order_display}</div>")
-                        elif key == "values" and isinstance(value, dict):
-                            # Format value table with hex values in a pretty list
-                            details_html.append(f"<div style='margin-bottom:12px;'><b>{key.replace('_', ' ').title()}:</b></div>")
-                            details_html.append("<div style='background-color:#f0f4f8; border-radius:6px; padding:10px; margin-left:10px;'>")
-                            for enum_val, enum_name in sorted(value.items()):
-                                hex_val = hex(enum_val)
-                                details_html.append(f"<div style='margin-bottom:6px; padding:4px 8px; background-color:#ffffff; border-radius:4px; border-left:3px solid #3498DB;'><span style='color:#E67E22; font-weight:bold;'>{hex_val}</span> → <span style='color:#2C3E50;'>{enum_name}</span></div>")
-                            details_html.append("</div>")
-                        elif isinstance(value, list):
-                            details_html.append(f"<div style='margin-bottom:8px;'><b>{key.replace('_', ' ').title()}:</b> {', '.join(map(str, value))}</div>")
-                        else:
-                            details_html.append(f"<div style='margin-bottom:8px;'><b>{key.replace('_', ' ').title()}:</b> {value}</div>")
-                    details_html.append("</div>")
-                elif "Type" in item_data and item_data["Type"] == "Senders List":
-                    self.details_title_label.setText("Senders List")
-                    details_html.append("<div style='background-color:#f7fafc; border-radius:8px; padding:18px; border:1px solid #e0e0e0;'>")
-                    details_html.append(f"<div><b>Senders:</b> {', '.join(item_data['Senders'])}</div>")
-                    details_html.append("</div>")
-                else:
-                    self.details_title_label.setText("Item Details")
-                    details_html.append("<div style='text-align:center; color:#7F8C8D;'><i>Select an item from the tree to view its details.</i></div>")
-            else:
-                self.details_title_label.setText("Item Details")
-                details_html.append("<div style='text-align:center; color:#7F8C8D;'><i>Select an item from the tree to view its details.</i></div>")
-            self.details_text_edit.setHtml("".join(details_html))
-        except Exception as e:
-            self._show_error(f"Error displaying item details: {e}")
+            _TreeNode(root, msg_data.message_name,
+                      f"Frame ID: {msg_data._frame_hex} ({msg_data._frame_type})", "Message",
+                      msg_data, builder=self._add_message_rows)
+        self.tree_model.set_root(root)
+
+        if len(data) > self.LARGE_TREE_MESSAGES:
+            # Expanding every subtree of a large DBC produces a huge, slow
+            # to lay out view; show just the message level instead
+            self.tree_view.expandToDepth(0)
+        else:
+            self._expand_to_signals(root)
+
+    def _expand_to_signals(self, node):
+        """Expand everything below node down to the signal rows; signals stay collapsed."""
+        view, model = self.tree_view, self.tree_model
+        for child in node.children:
+            if child.texts[2] != "Signal" and child.has_children():
+                view.setExpanded(model.index_of(child), True)
+                self._expand_to_signals(child)
+
+    def _add_message_rows(self, msg_node):
+        """Add the property, sender and signal rows under a message row (builder for message nodes)."""
+        msg_data = msg_node.data
+        frame_id = msg_data.frame_id
+        frame_hex = msg_data._frame_hex
+        frame_type = msg_data._frame_type
+
+        # Message properties
+        msg_props_item = self._tree_add_group(msg_node, "Message Properties", "Group")
+        self._tree_add_row(msg_props_item, "Length", msg_data._length_str, "int")
+        self._tree_add_row(msg_props_item, "Frame ID", f"{frame_hex} (decimal: {frame_id})", "int")
+        self._tree_add_row(msg_props_item, "Frame Type", frame_type, "str")
+
+        # Senders
+        senders = msg_data.senders
+        senders_item = self._tree_add_row(msg_node, "Senders", msg_data._senders_str, "List")
+        senders_item.data = {"Type": "Senders List", "Senders": senders}
+
+        # Signals grouped by name for fast lookup
+        signals = msg_data.signals
+        signals_by_name = {sig.signal_name: sig for sig in signals}
+
+        # Signal Groups -> Signals
+        signal_groups = msg_data.signal_groups
+        if signal_groups:
+            signal_groups_item = self._tree_add_group(msg_node, "Signal Groups", "Collection")
+            for group_name, group_signal_names in signal_groups:
+                group_item = self._tree_add_group(signal_groups_item, group_name, "Group")
+                group_item.data = {"Type": "Signal Group", "Name": group_name, "Signals": group_signal_names}
+
+                group_signals = [signals_by_name[name] for name in group_signal_names
+                                 if name in signals_by_name]
+                self._add_signals_to_tree(group_item, group_signals)
+
+        # Ungrouped signals (or all signals if no groups). A signal shown in
+        # this message is placed under every group in its signal_groups, so
+        # that precomputed membership decides without a name lookup.
+        if not signal_groups:
+            # Common case: no signal groups, so every signal is ungrouped
+            ungrouped = signals
+        else:
+            ungrouped = [sig for sig in signals if not sig.signal_groups]
+        if ungrouped:
+            title = "Ungrouped Signals" if signal_groups else "Signals"
+            root = self._tree_add_group(msg_node, title, "Collection")
+            self._add_signals_to_tree(root, ungrouped)
+
+    @staticmethod
+    def _signal_cards_html(signals):
+        """HTML cards for the signals in the message details view."""
+        # Bound once: this runs for every signal of the message
+        card = _SIG_CARD_TMPL.format
+        comments_div = _SIG_COMMENTS_TMPL.format
+        return "".join([
+            card(
+                name=sig.signal_name,
+                comments=comments_div(comments=sig.comments) if sig.comments else "",
+                receivers=sig._receivers_str,
+                is_signed=sig.is_signed,
+                minimum=sig.minimum,
+                maximum=sig.maximum,
+                start_bit_length=sig.start_bit_length,
+            )
+            for sig in signals
+        ])
+
+    @staticmethod
+    def _signal_field_html(sig, key, label, value):
+        """HTML row for one field of sig in the signal details view."""
+        # Format byte_order with Intel/Motorola labels
+        if key == "byte_order":
+            byte_order_display = f"{value} (Intel)" if value == "little_endian" else f"{value} (Motorola)"
+            return _FIELD_TMPL.format(label=label, value=byte_order_display)
+        if key == "values" and isinstance(value, dict):
+            # Format value table with hex values in a pretty list (rows are
+            # sorted and hex-formatted once by DBCProcessor.load_dbc_file)
+            enum_row = _ENUM_ROW_TMPL.format
+            rows = "".join([enum_row(hex_val=hex_val, name=enum_name)
+                            for hex_val, enum_name in sig._value_rows])
+            return _VALUE_TABLE_TMPL.format(label=label, rows=rows)
+        if isinstance(value, (list, tuple)):
+            value = ', '.join(map(str, value))
+        return _FIELD_TMPL.format(label=label, value=value)
+
+    def _render_message_details(self, msg):
+        header = _MSG_HEADER_TMPL.format(frame_id=msg._frame_hex, senders=", ".join(msg.senders))
+        if msg.signals:
+            body = _SIGNALS_HEADING + self._signal_cards_html(msg.signals)
+        else:
+            body = _NO_SIGNALS_HTML
+        return f"Message: {msg.message_name}", header + body
+
+    def _render_signal_details(self, sig):
+        field_html = self._signal_field_html
+        details_html = (_PANEL_OPEN
+                        + "".join([field_html(sig, key, label, getattr(sig, key))
+                                   for key, label in _SIG_FIELD_LABELS])
+                        + "</div>")
+        return f"Signal: {sig.signal_name}", details_html
+
+    @staticmethod
+    def _render_row_dict_details(row_data):
+        if row_data.get("Type") == "Senders List":
+            return "Senders List", _SENDERS_TMPL.format(senders=", ".join(row_data['Senders']))
+        return "Item Details", _NO_SELECTION_HTML
+
+    def _render_item_details(self, item_data):
+        """Return the (title, html) shown in the details panel for a tree item's data."""
+        renderer = self._detail_renderers.get(type(item_data))
+        if renderer is None:
+            return "Item Details", _NO_SELECTION_HTML
+        return renderer(item_data)
+
+    def display_item_details(self, index, delay_ms=None):
+        """
+        Queue a details panel update for the clicked or current row.
+        Only the row queued last is rendered, delay_ms (default
+        NAV_RENDER_DELAY_MS) after the last call.
+        """
+        # Keep the row's data, not the index: a model reset invalidates indexes
+        self._pending_item_data = self.tree_model.node(index).data if index.isValid() else None
+        self._details_pending = True
+        # While the panel is hidden nothing is rendered; showEvent flushes it
+        if self.details_text_edit.isVisible():
+            self._render_timer.start(self.NAV_RENDER_DELAY_MS if delay_ms is None else delay_ms)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._details_pending:
+            self._render_timer.start(0)
+
+    def _flush_pending_render(self):
+        if not self._details_pending or not self.details_text_edit.isVisible():
+            return
+        item_data = self._pending_item_data
+        self._details_pending = False
+        self._pending_item_data = None
+        if item_data is None:
+            self.details_title_label.setText("Item Details")
+            self.details_text_edit.setHtml(_NO_SELECTION_HTML)
+            return
+        # Records are stored once per tree build, so re-clicking a row
+        # reuses its HTML. Dict row data (senders list) is cheap to render
+        # and unhashable, so it is not cached.
+        cacheable = isinstance(item_data, (MessageRec, SignalRec))
+        cache = self._detail_html_cache
+        rendered = cache.get(item_data) if cacheable else None
+        if rendered is None:
+            # PyQt aborts on exceptions escaping a slot, so a render failure
+            # is reported instead of raised
+            try:
+                rendered = self._render_item_details(item_data)
+            except Exception as e:
+                self._show_error(f"Error displaying item details: {e}")
+                return
+            if cacheable:
+                cache[item_data] = rendered
+                if len(cache) > self.DETAIL_CACHE_SIZE:
+                    cache.popitem(last=False)
+        else:
+            cache.move_to_end(item_data)
+        title, details_html = rendered
+        self.details_title_label.setText(title)
+        self.details_text_edit.setHtml(details_html)
 
 
 
@@ -820,8 +1331,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Update recents whenever a page successfully loads a DBC
         self.view_dbc_page.dbcFileLoaded.connect(self._on_dbc_file_loaded)
-        if hasattr(self.edit_dbc_page, "dbcFileLoaded"):
-            self.edit_dbc_page.dbcFileLoaded.connect(self._on_dbc_file_loaded)
+        edit_loaded = getattr(self.edit_dbc_page, "dbcFileLoaded", None)
+        if edit_loaded is not None:
+            edit_loaded.connect(self._on_dbc_file_loaded)
+        # The editor page may not support direct loading; resolved once here
+        self._edit_loader = getattr(self.edit_dbc_page, "load_dbc_path", None)
 
         self._create_status_bar()
 
@@ -829,16 +1343,18 @@ class MainWindow(QtWidgets.QMainWindow):
         """Return to the Home screen."""
         try:
             self._stack.setCurrentWidget(self.home_page)
-            self.home_page.refresh_recent_files()
+            self.home_page.refresh_if_stale()
         except Exception as e:
             print(f"Error showing home: {e}")
 
     def _on_dbc_file_loaded(self, file_path: str) -> None:
         try:
             if file_path:
-                self._recent_files.add_file(file_path)
                 if hasattr(self, "home_page"):
-                    self.home_page.refresh_recent_files()
+                    # Records the file and moves just its row to the top
+                    self.home_page.add_recent(file_path)
+                else:
+                    self._recent_files.add_file(file_path)
         except Exception as e:
             print(f"Error updating recent files: {e}")
 
@@ -846,7 +1362,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._stack.setCurrentWidget(self.tab_widget)
         self.tab_widget.setCurrentIndex(0)
         if file_path:
-            ok = self.view_dbc_page.load_dbc_path(str(file_path))
+            ok = self.view_dbc_page.load_dbc_path(os.fspath(file_path))
             if not ok:
                 # If load fails, return to home so the user can pick another file
                 self._stack.setCurrentWidget(self.home_page)
@@ -854,8 +1370,8 @@ class MainWindow(QtWidgets.QMainWindow):
     def _open_edit_dbc(self, file_path):
         self._stack.setCurrentWidget(self.tab_widget)
         self.tab_widget.setCurrentIndex(1)
-        if file_path and hasattr(self.edit_dbc_page, "load_dbc_path"):
-            ok = self.edit_dbc_page.load_dbc_path(str(file_path))
+        if file_path and self._edit_loader is not None:
+            ok = self._edit_loader(os.fspath(file_path))
             if not ok:
                 self._stack.setCurrentWidget(self.home_page)
 
@@ -866,9 +1382,9 @@ class MainWindow(QtWidgets.QMainWindow):
     def _set_app_icon(self):
         """Set the application icon if the icon file exists."""
         try:
-            icon_path = get_resource_path("icons/app_icon.ico")
-            if os.path.exists(icon_path):
-                icon = QtGui.QIcon(icon_path)
+            icon_path = "icons/app_icon.ico"
+            icon = load_icon(icon_path)
+            if icon is not None:
                 # Set window icon (this affects the window title bar)
                 self.setWindowIcon(icon)
                 # Ensure application icon is set (this affects taskbar)
@@ -881,9 +1397,9 @@ class MainWindow(QtWidgets.QMainWindow):
     def _get_tab_icon(self, icon_path):
         """Get icon for tab if the icon file exists."""
         try:
-            full_icon_path = get_resource_path(icon_path)
-            if os.path.exists(full_icon_path):
-                return QtGui.QIcon(full_icon_path)
+            icon = load_icon(icon_path)
+            if icon is not None:
+                return icon
         except Exception as e:
             print(f"Could not load tab icon {icon_path}: {e}")
         return QtGui.QIcon()  # Return empty icon if file doesn't exist
@@ -9,8 +9,37 @@ import os
 import logging
 import json
 import shutil
+import operator
+import re
 from typing import Dict, List, Any, Optional
-import cantools
+
+# cantools is imported inside the methods that need it: it is slow to import
+# and the editor tab is created at startup, long before a DBC is opened
+
+# Fields read from every cantools Signal when loading; one C-level call per signal
+_signal_fields = operator.attrgetter(
+    'name', 'start', 'length', 'is_signed', 'scale', 'offset',
+    'minimum', 'maximum', 'unit', 'receivers',
+)
+
+# Replacements applied to raw comment strings by _extract_comment_from_dict
+_COMMENT_REPLACEMENTS = {
+    "\\'": "'",
+    '\\"': '"',
+    '{None: ': '',
+    '}': '',
+    'ÃƒÆÃ†â€™Ãƒâ€šÃ‚Â¢ÃƒÆÃ‚Â¢ÃƒÂ¢Ã¢â€šÂ¬Ã…Â¡Ãƒâ€šÃ‚Â¬ÃƒÆÃ¢â‚¬Å¡Ãƒâ€šÃ‚Â¦': '',  # encoding artifact
+}
+_COMMENT_FIXUPS = re.compile('|'.join(map(re.escape, _COMMENT_REPLACEMENTS)))
+
+def _comment_fixup(match):
+    return _COMMENT_REPLACEMENTS[match.group(0)]
+
+_item_name = operator.itemgetter('name')
+
+def _by_name(items):
+    """Map message/signal dicts by their 'name' (later duplicates win)."""
+    return dict(zip(map(_item_name, items), items))
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,6 +53,10 @@ class DBCEditor:
         self.file_path = None
         self._original_data = None
         self._modified_data = None
+        # Cached has_changes()/get_changes_summary() results; None until
+        # computed, cleared on every edit
+        self._has_changes = None
+        self._changes_summary = None
 
     def create_new_dbc(self) -> Dict[str, Any]:
         """
@@ -31,10 +64,11 @@ class DBCEditor:
         Returns a dict with empty messages list.
         """
         try:
+            import cantools
             self.db = cantools.database.Database()
             self.file_path = None
             self._original_data = {'messages': []}
-            self._modified_data = {'messages': []}
+            self._modified_data = self._original_data
             
             logger.info("Created new empty DBC file")
             return self._original_data
@@ -54,54 +88,32 @@ class DBCEditor:
             if not file_path.lower().endswith('.dbc'):
                 raise DBCEditorError("File must have .dbc extension")
             
+            import cantools
             self.file_path = file_path
             self.db = cantools.database.load_file(file_path)
             messages_data = []
+            # Comment objects are often shared between signals; keyed by id(),
+            # which is safe because self.db keeps them all alive during the load
+            comment_cache = {}
             
             for msg in self.db.messages:
                 signals_data = []
                 for sig in msg.signals:
-                    # Safely get signal properties with defaults
-                    try:
-                        scale = getattr(sig, 'scale', 1.0)
-                        if hasattr(scale, '__call__'):  # If scale is a callable
-                            scale = scale()
-                    except:
-                        scale = 1.0
-                    
-                    try:
-                        offset = getattr(sig, 'offset', 0.0)
-                        if hasattr(offset, '__call__'):  # If offset is a callable
-                            offset = offset()
-                    except:
-                        offset = 0.0
-                    
-                    try:
-                        minimum = getattr(sig, 'minimum', None)
-                        if hasattr(minimum, '__call__'):  # If minimum is a callable
-                            minimum = minimum()
-                    except:
-                        minimum = None
-                    
-                    try:
-                        maximum = getattr(sig, 'maximum', None)
-                        if hasattr(maximum, '__call__'):  # If maximum is a callable
-                            maximum = maximum()
-                    except:
-                        maximum = None
-                    
+                    (name, start_bit, length, is_signed, scale, offset,
+                     minimum, maximum, unit, receivers) = _signal_fields(sig)
+                    comments = getattr(sig, 'comments', '')
                     signals_data.append({
-                        'name': sig.name,
-                        'start_bit': getattr(sig, 'start', 0),
-                        'length': getattr(sig, 'length', 1),
-                        'is_signed': getattr(sig, 'is_signed', False),
+                        'name': name,
+                        'start_bit': start_bit,
+                        'length': length,
+                        'is_signed': is_signed,
                         'scale': scale,
                         'offset': offset,
                         'minimum': minimum,
                         'maximum': maximum,
-                        'unit': getattr(sig, 'unit', '') or '',
-                        'receivers': [str(r) for r in getattr(sig, 'receivers', [])],
-                        'comments': self._extract_comment_text(getattr(sig, 'comments', '')) if getattr(sig, 'comments', '') else ''
+                        'unit': unit or '',
+                        'receivers': [str(r) for r in receivers],
+                        'comments': self._cached_comment_text(comment_cache, comments) if comments else ''
                     })
                 
                 messages_data.append({
@@ -110,41 +122,13 @@ class DBCEditor:
                     'length': msg.length,
                     'senders': [str(s) for s in msg.senders],
                     'signals': signals_data,
-                    'comments': self._extract_comment_text(msg.comment) if msg.comment else ''
+                    'comments': self._cached_comment_text(comment_cache, msg.comment) if msg.comment else ''
                 })
             
             self._original_data = {'messages': messages_data}
-            # Create a proper deep copy for modified data
-            self._modified_data = {
-                'messages': [
-                    {
-                        'name': msg['name'],
-                        'frame_id': msg['frame_id'],
-                        'length': msg['length'],
-                        'senders': msg['senders'].copy(),
-                        'signals': [
-                            {
-                                'name': sig['name'],
-                                'start_bit': sig['start_bit'],
-                                'length': sig['length'],
-                                'is_signed': sig['is_signed'],
-                                'scale': sig['scale'],
-                                'offset': sig['offset'],
-                                'minimum': sig['minimum'],
-                                'maximum': sig['maximum'],
-                                'unit': sig['unit'],
-                                'receivers': sig['receivers'].copy(),
-                                'comments': sig['comments']
-                            }
-                            for sig in msg['signals']
-                        ],
-                        'comments': msg['comments']
-                    }
-                    for msg in messages_data
-                ]
-            }
+            # Shared until the first edit, see _ensure_writable()
+            self._modified_data = self._original_data
             
-            # Verify the copy is independent
             logger.info(f"Original data has {len(self._original_data['messages'])} messages")
             logger.info(f"Modified data has {len(self._modified_data['messages'])} messages")
             
@@ -155,15 +139,45 @@ class DBCEditor:
             logger.error(f"Failed to load DBC: {e}")
             raise DBCEditorError(f"Failed to load DBC: {e}")
 
+    @staticmethod
+    def _copy_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Copy a message list so that edits to the copy never reach the source.
+        Message and signal dicts hold scalars apart from the senders, signals
+        and receivers lists, so copying those is enough for a full deep copy.
+        """
+        return [
+            {
+                **msg,
+                'senders': list(msg['senders']),
+                'signals': [{**sig, 'receivers': list(sig['receivers'])} for sig in msg['signals']],
+            }
+            for msg in messages
+        ]
+
+    def _ensure_writable(self) -> None:
+        """
+        Prepare for an edit; every mutator calls this first.
+        Gives _modified_data its own copy of the messages (after loading, saving
+        or resetting it is the same object as _original_data, so sessions that
+        only view a DBC never copy it) and drops the cached change results.
+        """
+        self._has_changes = None
+        self._changes_summary = None
+        if self._modified_data is not None and self._modified_data is self._original_data:
+            self._modified_data = {'messages': self._copy_messages(self._original_data['messages'])}
+
     def get_data(self) -> Dict[str, Any]:
         return self._modified_data if self._modified_data else {}
 
     def add_message(self, message: Dict[str, Any]) -> None:
+        self._ensure_writable()
         if not self._modified_data:
             self._modified_data = {'messages': []}
         self._modified_data['messages'].append(message)
 
     def update_message(self, idx: int, message: Dict[str, Any]) -> None:
+        self._ensure_writable()
         if not self._modified_data or idx >= len(self._modified_data['messages']):
             raise DBCEditorError("Invalid message index")
         self._modified_data['messages'][idx] = message
@@ -173,6 +187,7 @@ class DBCEditor:
         Duplicate a message at idx and append it to the list.
         Returns the new message index.
         """
+        self._ensure_writable()
         if not self._modified_data or idx < 0 or idx >= len(self._modified_data['messages']):
             raise DBCEditorError("Invalid message index")
         original = self._modified_data['messages'][idx]
@@ -201,6 +216,7 @@ class DBCEditor:
         Move message at idx up by one position.
         Returns the new index.
         """
+        self._ensure_writable()
         if not self._modified_data or idx <= 0 or idx >= len(self._modified_data['messages']):
             raise DBCEditorError("Invalid message move operation")
         msgs = self._modified_data['messages']
@@ -212,6 +228,7 @@ class DBCEditor:
         Move message at idx down by one position.
         Returns the new index.
         """
+        self._ensure_writable()
         if not self._modified_data or idx < 0 or idx >= len(self._modified_data['messages']) - 1:
             raise DBCEditorError("Invalid message move operation")
         msgs = self._modified_data['messages']
@@ -219,17 +236,20 @@ class DBCEditor:
         return idx + 1
 
     def delete_message(self, idx: int) -> None:
+        self._ensure_writable()
         if not self._modified_data or idx >= len(self._modified_data['messages']):
             raise DBCEditorError("Invalid message index")
         del self._modified_data['messages'][idx]
 
     def add_signal(self, msg_idx: int, signal: Dict[str, Any]) -> None:
+        self._ensure_writable()
         if not self._modified_data or msg_idx >= len(self._modified_data['messages']):
             raise DBCEditorError("Invalid message index")
         self._modified_data['messages'][msg_idx]['signals'].append(signal)
         logger.info(f"Added signal '{signal['name']}' to message {msg_idx}")
 
     def update_signal(self, msg_idx: int, sig_idx: int, signal: Dict[str, Any]) -> None:
+        self._ensure_writable()
         if not self._modified_data or msg_idx >= len(self._modified_data['messages']):
             raise DBCEditorError("Invalid message index")
         if sig_idx >= len(self._modified_data['messages'][msg_idx]['signals']):
@@ -242,6 +262,7 @@ class DBCEditor:
         Duplicate signal at sig_idx within message msg_idx.
         Returns the index of the newly created signal.
         """
+        self._ensure_writable()
         if not self._modified_data or msg_idx < 0 or msg_idx >= len(self._modified_data['messages']):
             raise DBCEditorError("Invalid message index")
         signals = self._modified_data['messages'][msg_idx]['signals']
@@ -266,6 +287,7 @@ class DBCEditor:
         Move signal at sig_idx up within message msg_idx.
         Returns new signal index.
         """
+        self._ensure_writable()
         if (not self._modified_data or
             msg_idx < 0 or msg_idx >= len(self._modified_data['messages'])):
             raise DBCEditorError("Invalid message index")
@@ -280,6 +302,7 @@ class DBCEditor:
         Move signal at sig_idx down within message msg_idx.
         Returns new signal index.
         """
+        self._ensure_writable()
         if (not self._modified_data or
             msg_idx < 0 or msg_idx >= len(self._modified_data['messages'])):
             raise DBCEditorError("Invalid message index")
@@ -290,6 +313,7 @@ class DBCEditor:
         return sig_idx + 1
 
     def delete_signal(self, msg_idx: int, sig_idx: int) -> None:
+        self._ensure_writable()
         if not self._modified_data or msg_idx >= len(self._modified_data['messages']):
             raise DBCEditorError("Invalid message index")
         if sig_idx >= len(self._modified_data['messages'][msg_idx]['signals']):
@@ -301,7 +325,8 @@ class DBCEditor:
     def save_dbc_file(self, file_path: Optional[str] = None) -> None:
         """
         Save the modified DBC data to a file using cantools.
-        Creates a backup of the original file before saving.
+        The DBC text is written to a temporary file next to the target, which
+        then replaces it in one rename; the original is never half-written.
         """
         try:
             if file_path is None:
@@ -309,13 +334,8 @@ class DBCEditor:
             if not file_path:
                 raise DBCEditorError("No file path specified for saving")
             
-            # Create backup of original file
-            if os.path.exists(file_path):
-                backup_path = file_path + '.backup'
-                shutil.copy2(file_path, backup_path)
-                logger.info(f"Created backup: {backup_path}")
-            
             # Rebuild cantools database from modified data
+            import cantools
             db = cantools.database.Database()
             
             for msg in self._modified_data['messages']:
@@ -360,15 +380,29 @@ class DBCEditor:
                 
                 db.messages.append(message)
             
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(db.as_dbc_string())
+            # Encoded once and written as bytes: no text-layer copy of a
+            # possibly large string, and no newline translation of the
+            # '\r\n' line endings cantools already emits
+            dbc_bytes = db.as_dbc_string().encode('utf-8')
             
-            # Update original data to reflect saved state
-            self._original_data = {'messages': [dict(m) for m in self._modified_data['messages']]}
+            # Write to a temporary file, then swap it in atomically
+            tmp_path = file_path + '.new'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(dbc_bytes)
+                    f.flush()
+                    os.fsync(f.fileno())
+                if os.path.exists(file_path):
+                    shutil.copymode(file_path, tmp_path)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             
-            # Clean up backup file after successful save
-            self._cleanup_backup_file(file_path)
+            # Update original data to reflect saved state
+            # The next edit copies it again (see _ensure_writable)
+            self._original_data = self._modified_data
             
             logger.info(f"Saved DBC file: {file_path}")
             
@@ -377,10 +411,22 @@ class DBCEditor:
             raise DBCEditorError(f"Failed to save DBC: {e}")
 
     def has_changes(self) -> bool:
-        """Improved change detection using deep comparison."""
+        """
+        Whether the modified data differs from the original.
+        The deep comparison runs at most once between edits; its result is
+        cached until the next mutator call.
+        """
         if not self._original_data or not self._modified_data:
             return False
-        
+        if self._modified_data is self._original_data:
+            # Nothing has been edited since the last load/save/reset
+            return False
+        if self._has_changes is None:
+            self._has_changes = self._compare_data()
+        return self._has_changes
+
+    def _compare_data(self) -> bool:
+        """Improved change detection using deep comparison."""
         try:
             # Compare message counts first
             orig_msg_count = len(self._original_data['messages'])
@@ -426,13 +472,22 @@ class DBCEditor:
                 return self._original_data != self._modified_data
 
     def get_changes_summary(self) -> Dict[str, Any]:
-        """Get a detailed summary of changes made to the DBC file."""
+        """
+        Get a detailed summary of changes made to the DBC file.
+        Like has_changes(), the result is cached until the next edit; the
+        editor refreshes its changes label on every selection change.
+        """
         if not self.has_changes():
             return {"has_changes": False}
-        
+        if self._changes_summary is None:
+            self._changes_summary = self._diff_summary()
+        return self._changes_summary
+
+    def _diff_summary(self) -> Dict[str, Any]:
+        """Diff the original and modified messages/signals by name."""
         try:
-            orig = {m['name']: m for m in self._original_data['messages']}
-            mod = {m['name']: m for m in self._modified_data['messages']}
+            orig = _by_name(self._original_data['messages'])
+            mod = _by_name(self._modified_data['messages'])
             
             added_messages = [n for n in mod if n not in orig]
             deleted_messages = [n for n in orig if n not in mod]
@@ -452,8 +507,8 @@ class DBCEditor:
                         modified_messages.append(msg_name)
                         
                         # Check signal changes within this message
-                        orig_signals = {s['name']: s for s in orig_msg.get('signals', [])}
-                        mod_signals = {s['name']: s for s in mod_msg.get('signals', [])}
+                        orig_signals = _by_name(orig_msg.get('signals', []))
+                        mod_signals = _by_name(mod_msg.get('signals', []))
                         
                         # Added signals
                         for sig_name in mod_signals:
@@ -499,6 +554,16 @@ class DBCEditor:
         # For any other type, convert to string
         return str(comment_obj)
     
+    def _cached_comment_text(self, cache: Dict[int, str], comment_obj) -> str:
+        """_extract_comment_text, memoized in cache by object identity."""
+        if isinstance(comment_obj, str):
+            return comment_obj
+        key = id(comment_obj)
+        text = cache.get(key)
+        if text is None:
+            text = cache[key] = self._extract_comment_text(comment_obj)
+        return text
+    
     def _extract_comment_from_dict(self, comment_dict, max_depth):
         """Recursively extract comment text from nested dictionary."""
         if not isinstance(comment_dict, dict) or max_depth <= 0:
@@ -507,14 +572,9 @@ class DBCEditor:
         # Look for string values
         for key, value in comment_dict.items():
             if isinstance(value, str):
-                # Clean up the string - remove escape sequences and None references
-                cleaned = value.replace('\\\'', "'").replace('\\"', '"')
-                # Remove None key references and extra quotes
-                cleaned = cleaned.replace('{None: ', '').replace('}', '')
-                # Remove extra quotes at the beginning and end
-                cleaned = cleaned.strip("'\"")
-                # Remove encoding artifacts
-                cleaned = cleaned.replace('ÃƒÆÃ†â€™Ãƒâ€šÃ‚Â¢ÃƒÆÃ‚Â¢ÃƒÂ¢Ã¢â€šÂ¬Ã…Â¡Ãƒâ€šÃ‚Â¬ÃƒÆÃ¢â‚¬Å¡Ãƒâ€šÃ‚Â¦', '')
+                # Unescape quotes, drop '{None: ' / '}' wrappers and encoding
+                # artifacts in one pass, then remove surrounding quotes
+                cleaned = _COMMENT_FIXUPS.sub(_comment_fixup, value).strip("'\"")
                 return cleaned
             elif isinstance(value, dict):
                 result = self._extract_comment_from_dict(value, max_depth - 1)
@@ -526,7 +586,7 @@ class DBCEditor:
     def reset_changes(self) -> None:
         """Reset all changes back to the original state."""
         if self._original_data:
-            self._modified_data = {'messages': [dict(m) for m in self._original_data['messages']]}
+            self._modified_data = self._original_data
 
     def _cleanup_backup_file(self, file_path: str) -> None:
         """Delete the backup file for the given DBC file."""
@@ -14,7 +14,7 @@ import json
 from dbc_editor import DBCEditor, DBCEditorError
 from search_module import UnifiedSearchWidget
 
-from resource_utils import get_resource_path
+from resource_utils import load_icon
 
 class MessageEditDialog(QtWidgets.QDialog):
     """Enhanced dialog for editing message properties."""
@@ -671,9 +671,8 @@ class DBCEditorWidget(QtWidgets.QWidget):
     def _set_button_icon(self, button, icon_path):
         """Set icon for a button if the icon file exists."""
         try:
-            full_icon_path = get_resource_path(icon_path)
-            if os.path.exists(full_icon_path):
-                icon = QtGui.QIcon(full_icon_path)
+            icon = load_icon(icon_path)
+            if icon is not None:
                 button.setIcon(icon)
                 # Set icon size
                 button.setIconSize(QtCore.QSize(16, 16))
@@ -36,6 +36,16 @@ class RecentFilesManager(QtCore.QObject):
         super().__init__(parent)
         self._settings = QtCore.QSettings(organization, application)
         self._max_files = max(1, int(max_files))
+        # Bumped on every save, so views can tell whether they are stale
+        self._revision = 0
+
+    @property
+    def max_files(self) -> int:
+        return self._max_files
+
+    @property
+    def revision(self) -> int:
+        return self._revision
 
     def _load_entries(self) -> List[dict]:
         """
@@ -99,6 +109,7 @@ class RecentFilesManager(QtCore.QObject):
 
         unique = unique[: self._max_files]
         self._settings.setValue("recentFiles", json.dumps(unique))
+        self._revision += 1
 
     def get_recent_entries(self) -> List[dict]:
         """Return entries: [{'path': str, 'last_opened': int}, ...]."""
@@ -111,15 +122,18 @@ class RecentFilesManager(QtCore.QObject):
         entries = [{"path": os.path.normpath(str(p)), "last_opened": 0} for p in paths if p]
         self._save_entries(entries)
 
-    def add_file(self, path: str) -> None:
+    def add_file(self, path: str) -> Optional[dict]:
+        """Move path to the top of the list; returns the stored entry."""
         if not path:
-            return
+            return None
         path = os.path.normpath(path)
         now = int(time.time())
         entries = self._load_entries()
         entries = [e for e in entries if e.get("path") != path]
-        entries.insert(0, {"path": path, "last_opened": now})
+        entry = {"path": path, "last_opened": now}
+        entries.insert(0, entry)
         self._save_entries(entries)
+        return entry
 
     def remove_file(self, path: str) -> None:
         if not path:
@@ -167,6 +181,8 @@ class HomeScreenWidget(QtWidgets.QWidget):
         self._github = github
         self._recent_files = recent_files
         self._selected_path: Optional[str] = None
+        # RecentFilesManager.revision the list was last rebuilt from
+        self._shown_revision = -1
         self._setup_ui()
         # Keep the list clean (remove missing entries) silently on startup
         try:
@@ -312,8 +328,55 @@ class HomeScreenWidget(QtWidgets.QWidget):
         card.setMinimumWidth(700)
         card.setMaximumWidth(1000)
 
+    @staticmethod
+    def _recent_item_text(path: str, ts: int) -> str:
+        if ts > 0:
+            ts_text = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+            return f"{os.path.basename(path)} | last opened {ts_text}"
+        return f"{os.path.basename(path)} | last opened —"
+
+    def _new_recent_item(self, path: str, ts: int) -> QtWidgets.QListWidgetItem:
+        item = QtWidgets.QListWidgetItem(self._recent_item_text(path, ts))
+        item.setToolTip(path)
+        item.setData(QtCore.Qt.UserRole, path)
+        return item
+
+    def refresh_if_stale(self) -> None:
+        """Rebuild the recent-files list only if the stored list changed since it was shown."""
+        if self._shown_revision != self._recent_files.revision:
+            self.refresh_recent_files()
+
+    def add_recent(self, path: str) -> None:
+        """
+        Record path as the most recently opened file and move its row to the top,
+        without rebuilding the rest of the list.
+        """
+        up_to_date = self._shown_revision == self._recent_files.revision
+        entry = self._recent_files.add_file(path)
+        if entry is None:
+            return
+        if not up_to_date:
+            # Something else changed the stored list too; show it all
+            self.refresh_recent_files()
+            return
+
+        path, ts = entry["path"], entry["last_opened"]
+        recent_list = self.recent_list
+        for row in range(recent_list.count()):
+            existing = recent_list.item(row)
+            data = existing.data(QtCore.Qt.UserRole)
+            # The placeholder row has no path
+            if not data or data == path:
+                recent_list.takeItem(row)
+                break
+        recent_list.insertItem(0, self._new_recent_item(path, ts))
+        while recent_list.count() > self._recent_files.max_files:
+            recent_list.takeItem(recent_list.count() - 1)
+        self._shown_revision = self._recent_files.revision
+
     def refresh_recent_files(self) -> None:
         entries = self._recent_files.get_recent_entries()
+        self._shown_revision = self._recent_files.revision
 
         self.recent_list.clear()
         self._selected_path = None
@@ -330,17 +393,7 @@ class HomeScreenWidget(QtWidgets.QWidget):
             if not p:
                 continue
             ts = int(e.get("last_opened") or 0)
-            if ts > 0:
-                dt = datetime.fromtimestamp(ts)
-                ts_text = dt.strftime("%Y-%m-%d %H:%M")
-                text = f"{os.path.basename(p)} | last opened {ts_text}"
-            else:
-                text = f"{os.path.basename(p)} | last opened —"
-
-            item = QtWidgets.QListWidgetItem(text)
-            item.setToolTip(p)
-            item.setData(QtCore.Qt.UserRole, p)
-            self.recent_list.addItem(item)
+            self.recent_list.addItem(self._new_recent_item(p, ts))
 
     def _on_recent_selection_changed(self) -> None:
         items = self.recent_list.selectedItems()
@@ -373,8 +426,7 @@ class HomeScreenWidget(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "File not found", "The selected file does not exist.")
             return None
 
-        self._recent_files.add_file(file_path)
-        self.refresh_recent_files()
+        self.add_recent(file_path)
         return file_path
 
     def _request_view(self) -> None:
@@ -11,6 +11,7 @@ Centralizing this avoids duplicating the same logic across multiple modules.
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
 
@@ -31,3 +32,16 @@ def get_resource_path(relative_path: str) -> str:
     return os.path.join(project_root, relative_path)
 
 
+@functools.lru_cache(maxsize=32)
+def load_icon(relative_path: str):
+    """
+    Return a shared QtGui.QIcon for a bundled icon, or None if the file does not exist.
+
+    Each path is resolved, checked and loaded once per process.
+    """
+    full_path = get_resource_path(relative_path)
+    if not os.path.exists(full_path):
+        return None
+    # Imported here so non-GUI users of this module do not need PyQt5
+    from PyQt5 import QtGui
+    return QtGui.QIcon(full_path)